@@ -18,12 +18,14 @@ import random
 import time
 import logging
 from datetime import datetime
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 
 # ============================================================================
@@ -68,6 +70,10 @@ ERROR_LOG = os.path.join(os.path.dirname(__file__), "error_log.txt")
 MIN_DELAY = 3
 MAX_DELAY = 10
 
+# Turkish price text -> float literal (after removing "TL"): drop the lira
+# sign and thousands separators, turn the decimal comma into a point
+_PRICE_XLATE = str.maketrans({"₺": None, ".": None, ",": "."})
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
@@ -120,13 +126,41 @@ def create_driver():
 # PRICE EXTRACTION
 # ============================================================================
 
-def extract_price(driver, url, selector, product_name):
+# Fetch a page from inside the already-loaded tab and parse the price out of
+# its HTML, reusing the warm connection, cookies and cached assets
+FETCH_PRICE_JS = """
+    const [url, selector, done] = arguments;
+    fetch(url, {credentials: 'include'})
+        .then(r => r.text())
+        .then(html => {
+            const doc = new DOMParser().parseFromString(html, 'text/html');
+            const el = doc.querySelector(selector);
+            done(el ? el.textContent : null);
+        })
+        .catch(() => done(null));
+"""
+
+
+def fetch_price_text(driver, url, selector):
     """
-    Visit a product page and extract the price.
+    Get the raw price text for a product page.
+    
+    When the browser is already on the same site, the page is fetched in-tab
+    instead of navigated to. Falls back to a full page load when the price is
+    rendered client-side and not present in the served HTML, or when the
+    in-tab fetch times out.
     
     Returns:
-        tuple: (price_float, success_bool)
+        str or None: the price text, None if the page could not be read
     """
+    if urlparse(driver.current_url).netloc == urlparse(url).netloc:
+        try:
+            price_text = driver.execute_async_script(FETCH_PRICE_JS, url, selector)
+            if price_text and price_text.strip():
+                return price_text.strip()
+        except (TimeoutException, WebDriverException) as e:
+            logging.error(f"In-tab fetch failed for {url}, reloading page: {str(e)}")
+    
     try:
         driver.get(url)
         
@@ -135,16 +169,29 @@ def extract_price(driver, url, selector, product_name):
         price_element = wait.until(
             EC.presence_of_element_located((By.CSS_SELECTOR, selector))
         )
-        
+        return price_element.text.strip()
+    except (TimeoutException, WebDriverException) as e:
+        logging.error(f"Page load failed for {url}: {str(e)}")
+        return None
+
+
+def extract_price(driver, url, selector, product_name):
+    """
+    Visit a product page and extract the price.
+    
+    Returns:
+        tuple: (price_float, success_bool)
+    """
+    try:
         # Extract and clean price text
-        price_text = price_element.text.strip()
+        price_text = fetch_price_text(driver, url, selector)
+        if price_text is None:
+            print(f"✗ {product_name}: FAILED - page did not load")
+            return None, False
         
-        # Remove currency symbols and convert to float
+        # Remove currency symbols and convert to float in a single pass
         # Handle Turkish format: "123,45 TL" or "123.45 ₺"
-        price_clean = price_text.replace("TL", "").replace("₺", "").strip()
-        price_clean = price_clean.replace(".", "").replace(",", ".")
-        
-        price_float = float(price_clean)
+        price_float = float(price_text.replace("TL", "").translate(_PRICE_XLATE))
         
         print(f"✓ {product_name}: {price_float:.2f} TL")
         return price_float, True
@@ -186,22 +233,25 @@ def calculate_inflation_rate():
     
     try:
         import pandas as pd
-        df = pd.read_csv(CSV_FILE)
+        try:
+            # Arrow engine: multithreaded parse straight into columnar buffers
+            df = pd.read_csv(
+                CSV_FILE,
+                engine='pyarrow',
+                dtype_backend='pyarrow',
+                usecols=['Product_Name', 'Price']
+            )
+        except ImportError:
+            df = pd.read_csv(CSV_FILE, usecols=['Product_Name', 'Price'])
         
         if len(df) < 2:
             return None
         
-        # Group by product and get first/last prices
-        products = df.groupby('Product_Name')
-        
-        total_first = 0
-        total_last = 0
+        # Group by product and get first/last prices in one aggregation
+        prices = df.groupby('Product_Name', sort=False)['Price'].agg(['first', 'last'])
         
-        for name, group in products:
-            first_price = group.iloc[0]['Price']
-            last_price = group.iloc[-1]['Price']
-            total_first += first_price
-            total_last += last_price
+        total_first = float(prices['first'].sum())
+        total_last = float(prices['last'].sum())
         
         if total_first > 0:
             inflation_rate = ((total_last - total_first) / total_first) * 100
@@ -229,11 +279,15 @@ def main():
     
     try:
         driver = create_driver()
+        driver.set_script_timeout(15)
         now = datetime.now()
         date_str = now.strftime("%Y-%m-%d")
         time_str = now.strftime("%H:%M:%S")
         
-        for product in PRODUCT_URLS:
+        # Visit products site by site so in-tab fetches can reuse the session
+        products = sorted(PRODUCT_URLS, key=lambda p: urlparse(p["url"]).netloc)
+        
+        for product in products:
             # Random delay to avoid detection
             delay = random.uniform(MIN_DELAY, MAX_DELAY)
             time.sleep(delay)
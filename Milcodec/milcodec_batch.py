@@ -0,0 +1,90 @@
+"""
+MILCODEC BATCH ENCODER v2.0 - HEADLESS STEGANOGRAPHY
+=====================================================
+Embeds one encrypted message into many carrier WAVs at once, without the
+Studio window. Carriers are independent, so they are spread across cores.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from milcodec_engine import VERSION, DEFAULT_SNR, encode_file
+
+
+# =============================================================================
+# CLI INTERFACE
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(
+        description=f"Milcodec Batch Encoder v{VERSION}",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python milcodec_batch.py -t "ORDERS" -p secret songs/*.wav
+  python milcodec_batch.py -t "HIDDEN" -p secret -s -25 -o out a.wav b.wav
+        """
+    )
+
+    parser.add_argument("carriers", nargs="+",
+                        help="Carrier WAV files")
+    parser.add_argument("-t", "--text", type=str, required=True,
+                        help="Text message to encrypt and embed")
+    parser.add_argument("-p", "--password", type=str, required=True,
+                        help="Encryption password")
+    parser.add_argument("-o", "--output-dir", type=str, default="encoded",
+                        help="Directory for encoded files (default: encoded)")
+    parser.add_argument("-s", "--snr", type=float, default=DEFAULT_SNR,
+                        help=f"Target SNR in dB (default: {DEFAULT_SNR})")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes (default: one per core)")
+    parser.add_argument("-v", "--version", action="version", version=f"%(prog)s {VERSION}")
+
+    args = parser.parse_args()
+
+    out_dir = os.path.abspath(args.output_dir)
+    jobs = {}
+    for carrier in args.carriers:
+        if os.path.dirname(os.path.abspath(carrier)) == out_dir:
+            print(f"[BATCH] Skipping {carrier}: already in the output directory")
+            continue
+        jobs[carrier] = os.path.join(args.output_dir, os.path.basename(carrier))
+
+    # Outputs are named by basename, so carriers from different folders can
+    # collide; refuse rather than let parallel writers overwrite each other
+    by_output = {}
+    for carrier, out_path in jobs.items():
+        by_output.setdefault(os.path.normcase(os.path.abspath(out_path)), []).append(carrier)
+    clashes = [carriers for carriers in by_output.values() if len(carriers) > 1]
+    if clashes:
+        for carriers in clashes:
+            print(f"[ERROR] Same output name for: {', '.join(carriers)}")
+        parser.error("carrier file names must be unique; rename or encode them separately")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    print(f"[BATCH] Encoding {len(jobs)} carrier(s) at {args.snr} dB SNR")
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {
+            pool.submit(encode_file, carrier, out_path, args.text,
+                        args.password, args.snr): carrier
+            for carrier, out_path in jobs.items()
+        }
+        for future in as_completed(futures):
+            carrier = futures[future]
+            try:
+                print(f"[BATCH] {carrier} -> {future.result()}")
+            except Exception as e:
+                failed += 1
+                print(f"[ERROR] {carrier}: {e!r}")
+
+    print(f"[BATCH] Complete! ({len(jobs) - failed} ok, {failed} failed)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -20,14 +20,15 @@ from datetime import datetime
 # GUI Imports
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTextEdit, QLabel, QLineEdit, QPushButton, QFrame, QListWidget,
-    QSplitter, QComboBox, QListWidgetItem, QGroupBox, QRadioButton,
+    QTextEdit, QPlainTextEdit, QLabel, QLineEdit, QPushButton, QFrame, QListView,
+    QSplitter, QComboBox, QStyledItemDelegate, QGroupBox, QRadioButton,
     QButtonGroup, QSizePolicy, QGraphicsDropShadowEffect, QTabWidget
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QMutex, QSize
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QMutex, QSize, QRect
 from PyQt6.QtGui import (
     QColor, QPalette, QFont, QPainter, QBrush, QPen, QLinearGradient,
-    QIcon
+    QIcon, QRegion, QPixmap, QTextCharFormat, QTextCursor,
+    QStandardItem, QStandardItemModel
 )
 
 # Cryptography Imports
@@ -76,6 +77,17 @@ MODE_FM = "FM"
 # Priority Levels
 PRIORITIES = ["ROUTINE", "PRIORITY", "IMMEDIATE", "FLASH"]
 
+# Parsed QColor per colour string, shared by paint and log hot paths
+_QCOLOR_CACHE = {}
+
+
+def qc(name):
+    """Return a cached QColor for a colour string."""
+    color = _QCOLOR_CACHE.get(name)
+    if color is None:
+        color = _QCOLOR_CACHE[name] = QColor(name)
+    return color
+
 # =============================================================================
 # ENCRYPTION CORE
 # =============================================================================
@@ -176,10 +188,16 @@ class TransmissionEngine(QThread):
         if self.transmit_mode == MODE_RADIO or self.transmit_mode == MODE_FM:
             success, details = self._save_to_wav(audio_packet, priority)
         elif self.transmit_mode == MODE_INTERNET:
-            success, details = self._stream_internet(audio_packet)
+            # Completes asynchronously via _finish_tx
+            self._stream_internet(audio_packet)
+            return
         else:
             success, details = self._stream_tcp(audio_packet)
 
+        self._finish_tx(success, details)
+
+    def _finish_tx(self, success, details):
+        """Record the outcome of a transmission and notify listeners."""
         if success:
             self.orders_sent += 1
 
@@ -221,8 +239,10 @@ class TransmissionEngine(QThread):
     def _stream_internet(self, audio_data):
         """Stream to internet radio server (simulated)."""
         self.tx_status_signal.emit("CONNECTING TO STREAM SERVER...", "INFO")
-        time.sleep(0.5)  # Simulate connection
-        return True, "STREAM QUEUED (SIMULATION)"
+        # Simulate connection latency without blocking the event loop
+        QTimer.singleShot(
+            500, lambda: self._finish_tx(True, "STREAM QUEUED (SIMULATION)")
+        )
 
 
 # =============================================================================
@@ -231,58 +251,118 @@ class TransmissionEngine(QThread):
 class SpectrumAnalyzer(QFrame):
     """FFT Spectrum visualization with gradient bars."""
     
+    # Bar colour buckets by height ratio
+    COLOR_LOW = qc(Colors.CYAN)
+    COLOR_MID = qc(Colors.AMBER)
+    COLOR_HIGH = qc(Colors.RED)
+
     def __init__(self):
         super().__init__()
         self.setMinimumHeight(150)
-        self.data = []
+        self.data = np.zeros(0, dtype=np.float32)
+        self._prev_data = self.data
+        self._max_val = 0.0
         self.setStyleSheet("background: transparent;")
+        # paintEvent covers every exposed pixel; skip Qt's background erase
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+
+        # Coalesce bursts of spectrum updates to ~30 FPS
+        self._pending = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(33)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._flush)
+
+    def _bar_geometry(self, bar_count):
+        """Return (step, bar_width) for laying out bar_count bars."""
+        w = self.width()
+        return w / bar_count, max(2, w // bar_count - 1)
 
     def update_data(self, data):
-        self.data = data[:128] if len(data) > 128 else data
-        self.update()
+        self._pending = data
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        data, self._pending = self._pending, None
+
+        self._prev_data = self.data
+        self.data = np.asarray(data[:128], dtype=np.float32)
+
+        # Scale reference for bar heights, reduced once per frame
+        prev_max = self._max_val
+        self._max_val = float(self.data.max()) if len(self.data) else 0.0
+
+        prev = self._prev_data
+        if (len(prev) == 0 or len(prev) != len(self.data)
+                or prev_max != self._max_val):
+            # Layout or scale changed: every bar moves
+            self.update()
+            return
+
+        # Invalidate only the columns of bars whose value changed;
+        # QRegion merges adjacent rects into runs
+        step, bar_width = self._bar_geometry(len(self.data))
+        h = self.height()
+        region = QRegion()
+        for i in np.flatnonzero(self.data != prev):
+            region = region.united(QRect(int(i * step), 0, bar_width, h))
+
+        if not region.isEmpty():
+            self.update(region)
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         w, h = self.width(), self.height()
+        region = event.region()
 
         # Background
-        painter.fillRect(0, 0, w, h, QColor(Colors.VOID))
+        painter.fillRect(event.rect(), qc(Colors.VOID))
 
         # Grid
-        painter.setPen(QPen(QColor(Colors.BORDER_DIM), 1, Qt.PenStyle.DotLine))
+        painter.setPen(QPen(qc(Colors.BORDER_DIM), 1, Qt.PenStyle.DotLine))
         for y in range(0, h, 25):
             painter.drawLine(0, y, w, y)
 
-        if not self.data:
+        if len(self.data) == 0:
             # Draw placeholder
-            painter.setPen(QPen(QColor(Colors.TEXT_DIM)))
+            painter.setPen(QPen(qc(Colors.TEXT_DIM)))
             painter.drawText(w // 2 - 50, h // 2, "AWAITING SIGNAL")
             return
 
-        # Draw spectrum bars with gradient
+        # Bar geometry for the whole spectrum in a few vectorised passes
         bar_count = len(self.data)
-        bar_width = max(2, w // bar_count - 1)
-        max_val = max(self.data) if self.data else 1
-
-        for i, val in enumerate(self.data):
-            x = int(i * (w / bar_count))
-            bar_height = int((val / max_val) * h * 0.9)
-            
-            if bar_height < 2:
-                continue
-
-            # Gradient from cyan to amber based on height
-            ratio = bar_height / h
-            if ratio > 0.7:
-                color = QColor(Colors.RED)
-            elif ratio > 0.4:
-                color = QColor(Colors.AMBER)
-            else:
-                color = QColor(Colors.CYAN)
-
-            painter.fillRect(x, h - bar_height, bar_width, bar_height, color)
+        step, bar_width = self._bar_geometry(bar_count)
+        max_val = self._max_val or 1.0
+
+        xs = (np.arange(bar_count) * step).astype(np.int32)
+        heights = (self.data * (h * 0.9 / max_val)).astype(np.int32)
+        ratios = heights / h
+        visible = heights >= 2
+
+        # Gradient from cyan to amber to red based on height
+        buckets = (
+            (self.COLOR_HIGH, visible & (ratios > 0.7)),
+            (self.COLOR_MID, visible & (ratios > 0.4) & (ratios <= 0.7)),
+            (self.COLOR_LOW, visible & (ratios <= 0.4)),
+        )
+
+        # One brush change and one drawRects call per colour
+        painter.setPen(Qt.PenStyle.NoPen)
+        for color, mask in buckets:
+            rects = [
+                QRect(int(x), h - int(bar_height), bar_width, int(bar_height))
+                for x, bar_height in zip(xs[mask], heights[mask])
+            ]
+            rects = [r for r in rects if region.intersects(r)]
+            if rects:
+                painter.setBrush(QBrush(color))
+                painter.drawRects(rects)
 
 
 class TacticalMap(QFrame):
@@ -297,18 +377,61 @@ class TacticalMap(QFrame):
             {"id": "CHARLIE-9", "x": 0.5, "y": 0.7, "status": "PENDING"},
         ]
         self.hq_pos = (0.5, 0.5)
+        self._bg_pixmap = None
+        self._units_pixmap = None
+        # The background pixmap covers the whole widget
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Marker brush/pen per unit status
+        status_colors = {
+            "ACTIVE": Colors.GREEN,
+            "SILENT": Colors.AMBER,
+            "PENDING": Colors.TEXT_DIM,
+        }
+        self._unit_styles = {
+            status: (QBrush(qc(color)), QPen(qc(color)))
+            for status, color in status_colors.items()
+        }
+        self._default_style = (QBrush(qc(Colors.TEXT_DIM)), QPen(qc(Colors.TEXT_DIM)))
 
+    def set_hq_pos(self, x, y):
+        self.hq_pos = (x, y)
+        self._bg_pixmap = None
+        self.update()
+
+    def set_unit_position(self, unit_id, x, y):
+        for unit in self.units:
+            if unit["id"] == unit_id:
+                unit["x"], unit["y"] = x, y
+                self._units_pixmap = None
+                self.update()
+                return
+
+    def set_unit_status(self, unit_id, status):
+        for unit in self.units:
+            if unit["id"] == unit_id:
+                unit["status"] = status
+                self._units_pixmap = None
+                self.update()
+                return
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg_pixmap = None
+        self._units_pixmap = None
+
+    def _render_background(self):
+        """Render the static layer (grid, radar rings, HQ) into a pixmap."""
         w, h = self.width(), self.height()
+        pixmap = QPixmap(self.size())
+        pixmap.fill(qc(Colors.VOID))
 
-        # Background
-        painter.fillRect(0, 0, w, h, QColor(Colors.VOID))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Grid
-        painter.setPen(QPen(QColor(Colors.BORDER_DIM), 1))
+        painter.setPen(QPen(qc(Colors.BORDER_DIM), 1))
         grid_size = 40
         for x in range(0, w, grid_size):
             painter.drawLine(x, 0, x, h)
@@ -317,52 +440,104 @@ class TacticalMap(QFrame):
 
         # Radar circles
         cx, cy = w // 2, h // 2
-        painter.setPen(QPen(QColor(Colors.CYAN_DIM if hasattr(Colors, 'CYAN_DIM') else "#0088aa"), 1, Qt.PenStyle.DashLine))
+        painter.setPen(QPen(qc(getattr(Colors, 'CYAN_DIM', "#0088aa")), 1, Qt.PenStyle.DashLine))
         for r in range(50, max(w, h), 50):
             painter.drawEllipse(cx - r, cy - r, r * 2, r * 2)
 
         # HQ marker
         hx, hy = int(self.hq_pos[0] * w), int(self.hq_pos[1] * h)
-        painter.setBrush(QBrush(QColor(Colors.CYAN)))
+        painter.setBrush(QBrush(qc(Colors.CYAN)))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRect(hx - 6, hy - 6, 12, 12)
         
-        painter.setPen(QPen(QColor(Colors.CYAN)))
+        painter.setPen(QPen(qc(Colors.CYAN)))
         painter.drawText(hx + 10, hy + 4, "HQ")
 
-        # Unit markers
-        status_colors = {
-            "ACTIVE": Colors.GREEN,
-            "SILENT": Colors.AMBER,
-            "PENDING": Colors.TEXT_DIM,
-        }
+        painter.end()
+        return pixmap
+
+    def _render_units(self):
+        """Render the unit markers into a transparent overlay pixmap."""
+        w, h = self.width(), self.height()
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         for unit in self.units:
             ux = int(unit["x"] * w)
             uy = int(unit["y"] * h)
-            color = QColor(status_colors.get(unit["status"], Colors.TEXT_DIM))
+            brush, pen = self._unit_styles.get(unit["status"], self._default_style)
 
-            painter.setBrush(QBrush(color))
+            painter.setBrush(brush)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(ux - 5, uy - 5, 10, 10)
 
-            painter.setPen(QPen(color))
+            painter.setPen(pen)
             painter.drawText(ux + 8, uy + 4, unit["id"])
 
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._render_background()
+        if self._units_pixmap is None:
+            self._units_pixmap = self._render_units()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.drawPixmap(0, 0, self._units_pixmap)
+
 
-class UnitListItem(QListWidgetItem):
-    """Custom list item for unit roster."""
-    pass
+class UnitDelegate(QStyledItemDelegate):
+    """Unit roster delegate colouring each row by the unit's status."""
 
+    STATUS_COLORS = {
+        "ACTIVE": Colors.GREEN,
+        "SILENT": Colors.AMBER,
+        "PENDING": Colors.TEXT_DIM,
+    }
 
-class CommandHistory(QTextEdit):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._brushes = {
+            status: QBrush(qc(color)) for status, color in self.STATUS_COLORS.items()
+        }
+        self._default_brush = QBrush(qc(Colors.TEXT_DIM))
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        status = index.data(Qt.ItemDataRole.UserRole)
+        brush = self._brushes.get(status, self._default_brush)
+        option.palette.setBrush(QPalette.ColorRole.Text, brush)
+
+
+class CommandHistory(QPlainTextEdit):
     """Command log with colored output."""
     
+    MAX_LINES = 2000
+    LEVEL_COLORS = {
+        "INFO": Colors.CYAN,
+        "SUCCESS": Colors.GREEN,
+        "WARNING": Colors.AMBER,
+        "ERROR": Colors.RED,
+        "COMMAND": Colors.TEXT_PRIMARY,
+    }
+
     def __init__(self):
         super().__init__()
         self.setReadOnly(True)
+        self.setMaximumBlockCount(self.MAX_LINES)
+
+        self._pending_logs = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_logs)
         self.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {Colors.VOID};
                 border: 1px solid {Colors.BORDER_DIM};
                 border-radius: 4px;
@@ -373,54 +548,123 @@ class CommandHistory(QTextEdit):
         """)
 
     def log(self, text, level="INFO"):
-        colors = {
-            "INFO": Colors.CYAN,
-            "SUCCESS": Colors.GREEN,
-            "WARNING": Colors.AMBER,
-            "ERROR": Colors.RED,
-            "COMMAND": Colors.TEXT_PRIMARY,
-        }
-        color = colors.get(level, Colors.TEXT_SECONDARY)
+        color = self.LEVEL_COLORS.get(level, Colors.TEXT_SECONDARY)
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.append(f'<span style="color: {Colors.TEXT_DIM};">[{timestamp}]</span> '
-                   f'<span style="color: {color};">{text}</span>')
-        self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+
+        # Bursts are inserted together on the next flush
+        self._pending_logs.append((timestamp, text, color))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_logs(self):
+        if not self._pending_logs:
+            return
+        entries, self._pending_logs = self._pending_logs, []
+
+        # Only follow the tail if the user hasn't scrolled up
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        stamp_fmt = QTextCharFormat()
+        stamp_fmt.setForeground(qc(Colors.TEXT_DIM))
+        text_fmt = QTextCharFormat()
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for timestamp, text, color in entries:
+            if not self.document().isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(f"[{timestamp}] ", stamp_fmt)
+            text_fmt.setForeground(qc(color))
+            cursor.insertText(text, text_fmt)
+        cursor.endEditBlock()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
 
 # =============================================================================
 # MAIN WINDOW ("THE GLASS COCKPIT")
 # =============================================================================
+# Panel rules also cover descendant frames (labels included), matching the
+# cascade of the per-panel stylesheets they replace
+WINDOW_QSS = f"""
+    QMainWindow {{
+        background-color: {Colors.BACKGROUND};
+    }}
+    QLabel {{
+        color: {Colors.TEXT_PRIMARY};
+        font-family: 'Inter', 'Segoe UI', sans-serif;
+    }}
+    QFrame#headerPanel, QFrame#headerPanel QFrame {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {Colors.ELEVATED}, stop:1 {Colors.SURFACE});
+        border-bottom: 1px solid {Colors.BORDER};
+    }}
+    QFrame#leftPanel, QFrame#leftPanel QFrame,
+    QFrame#centerPanel, QFrame#centerPanel QFrame,
+    QFrame#rightPanel, QFrame#rightPanel QFrame {{
+        background-color: {Colors.SURFACE};
+        border: 1px solid {Colors.BORDER_DIM};
+        border-radius: 6px;
+    }}
+    QFrame#footerPanel, QFrame#footerPanel QFrame {{
+        background-color: {Colors.SURFACE};
+        border-top: 1px solid {Colors.BORDER};
+    }}
+    QLabel#txStatus {{
+        font-size: 9pt;
+        font-weight: bold;
+    }}
+    QLabel#txStatus[txState="ok"] {{
+        color: {Colors.GREEN};
+    }}
+    QLabel#txStatus[txState="fail"] {{
+        color: {Colors.RED};
+    }}
+"""
+
+
 class CommanderWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.tx_engine = TransmissionEngine()
         self.command_history = []
+        self._cmd_handlers = {
+            "/mode": self._cmd_mode,
+            "/all": self._cmd_all,
+            "/to": self._cmd_to,
+        }
         self.init_ui()
-        self.init_signals()
+        # Build the panels once the event loop is running, so the window
+        # frame and header paint before the heavy widgets exist
+        QTimer.singleShot(0, self._init_panels)
 
     def init_ui(self):
         self.setWindowTitle(f"MILCODEC COMMANDER v{VERSION} - GLASS COCKPIT")
         self.setGeometry(50, 50, 1200, 800)
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {Colors.BACKGROUND};
-            }}
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-family: 'Inter', 'Segoe UI', sans-serif;
-            }}
-        """)
 
         central = QWidget()
         self.setCentralWidget(central)
-        main_layout = QVBoxLayout(central)
-        main_layout.setSpacing(0)
-        main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout = QVBoxLayout(central)
+        self.main_layout.setSpacing(0)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
 
         # === HEADER ===
         header = self._create_header()
-        main_layout.addWidget(header)
+        self.main_layout.addWidget(header)
 
+        # Placeholder until _init_panels swaps in the content
+        self.loading_label = QLabel("LOADING C2 TERMINAL...")
+        self.loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.loading_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 11pt; letter-spacing: 2px;")
+        self.main_layout.addWidget(self.loading_label, stretch=1)
+
+        # Window and panel styling, parsed once for the whole tree
+        self.setStyleSheet(WINDOW_QSS)
+
+    def _init_panels(self):
         # === MAIN CONTENT ===
         content = QWidget()
         content_layout = QHBoxLayout(content)
@@ -439,11 +683,15 @@ class CommanderWindow(QMainWindow):
         right_panel = self._create_right_panel()
         content_layout.addWidget(right_panel, 2)
 
-        main_layout.addWidget(content, stretch=1)
+        self.main_layout.removeWidget(self.loading_label)
+        self.loading_label.deleteLater()
+        self.main_layout.addWidget(content, stretch=1)
 
         # === FOOTER ===
         footer = self._create_footer()
-        main_layout.addWidget(footer)
+        self.main_layout.addWidget(footer)
+
+        self.init_signals()
 
         # Initialize
         self.log_status("SYSTEM INITIALIZED", "SUCCESS")
@@ -452,13 +700,7 @@ class CommanderWindow(QMainWindow):
     def _create_header(self):
         header = QFrame()
         header.setFixedHeight(60)
-        header.setStyleSheet(f"""
-            QFrame {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {Colors.ELEVATED}, stop:1 {Colors.SURFACE});
-                border-bottom: 1px solid {Colors.BORDER};
-            }}
-        """)
+        header.setObjectName("headerPanel")
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(16, 0, 16, 0)
@@ -503,6 +745,13 @@ class CommanderWindow(QMainWindow):
             font-size: 12pt;
             color: {Colors.AMBER};
         """)
+        # Plain text at a fixed width: ticks never re-parse or re-measure
+        self.clock_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.clock_label.ensurePolished()
+        self.clock_label.setFixedWidth(
+            self.clock_label.fontMetrics().horizontalAdvance("0000-00-00 00:00:00") + 8
+        )
+        self._last_clock = None
         layout.addWidget(self.clock_label)
 
         # Clock timer
@@ -515,13 +764,7 @@ class CommanderWindow(QMainWindow):
 
     def _create_left_panel(self):
         panel = QFrame()
-        panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border: 1px solid {Colors.BORDER_DIM};
-                border-radius: 6px;
-            }}
-        """)
+        panel.setObjectName("leftPanel")
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -547,13 +790,7 @@ class CommanderWindow(QMainWindow):
 
     def _create_center_panel(self):
         panel = QFrame()
-        panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border: 1px solid {Colors.BORDER_DIM};
-                border-radius: 6px;
-            }}
-        """)
+        panel.setObjectName("centerPanel")
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -578,7 +815,9 @@ class CommanderWindow(QMainWindow):
         priority_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY};")
         priority_row.addWidget(priority_label)
 
+        self._current_priority = "ROUTINE"
         self.priority_group = QButtonGroup()
+        self.priority_group.idToggled.connect(self._on_priority)
         for i, p in enumerate(PRIORITIES):
             rb = QRadioButton(p)
             rb.setStyleSheet(f"""
@@ -654,13 +893,7 @@ class CommanderWindow(QMainWindow):
 
     def _create_right_panel(self):
         panel = QFrame()
-        panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border: 1px solid {Colors.BORDER_DIM};
-                border-radius: 6px;
-            }}
-        """)
+        panel.setObjectName("rightPanel")
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -671,39 +904,43 @@ class CommanderWindow(QMainWindow):
         units_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 9pt; font-weight: 600; letter-spacing: 1px;")
         layout.addWidget(units_label)
 
-        self.unit_list = QListWidget()
+        self.unit_model = QStandardItemModel(self)
+        self.unit_list = QListView()
+        self.unit_list.setModel(self.unit_model)
+        self.unit_list.setItemDelegate(UnitDelegate(self.unit_list))
         self.unit_list.setStyleSheet(f"""
-            QListWidget {{
+            QListView {{
                 background-color: {Colors.VOID};
                 border: 1px solid {Colors.BORDER_DIM};
                 border-radius: 4px;
                 padding: 4px;
             }}
-            QListWidget::item {{
+            QListView::item {{
                 padding: 8px;
                 border-radius: 3px;
                 color: {Colors.TEXT_PRIMARY};
             }}
-            QListWidget::item:hover {{
+            QListView::item:hover {{
                 background-color: {Colors.ELEVATED};
             }}
-            QListWidget::item:selected {{
+            QListView::item:selected {{
                 background-color: {Colors.CYAN};
                 color: {Colors.VOID};
             }}
         """)
 
         units = [
-            ("ALPHA-1", "ACTIVE", Colors.GREEN),
-            ("BRAVO-2", "SILENT", Colors.AMBER),
-            ("CHARLIE-9", "PENDING", Colors.TEXT_DIM),
-            ("DELTA-4", "ACTIVE", Colors.GREEN),
+            ("ALPHA-1", "ACTIVE"),
+            ("BRAVO-2", "SILENT"),
+            ("CHARLIE-9", "PENDING"),
+            ("DELTA-4", "ACTIVE"),
         ]
 
-        for name, status, color in units:
-            item = QListWidgetItem(f"● {name}  [{status}]")
-            item.setForeground(QColor(color))
-            self.unit_list.addItem(item)
+        for name, status in units:
+            item = QStandardItem(f"● {name}  [{status}]")
+            item.setData(status, Qt.ItemDataRole.UserRole)
+            item.setEditable(False)
+            self.unit_model.appendRow(item)
 
         layout.addWidget(self.unit_list)
 
@@ -760,12 +997,7 @@ class CommanderWindow(QMainWindow):
     def _create_footer(self):
         footer = QFrame()
         footer.setFixedHeight(40)
-        footer.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-top: 1px solid {Colors.BORDER};
-            }}
-        """)
+        footer.setObjectName("footerPanel")
 
         layout = QHBoxLayout(footer)
         layout.setContentsMargins(16, 0, 16, 0)
@@ -777,7 +1009,8 @@ class CommanderWindow(QMainWindow):
         layout.addStretch()
 
         self.tx_status = QLabel("READY")
-        self.tx_status.setStyleSheet(f"color: {Colors.GREEN}; font-size: 9pt; font-weight: bold;")
+        self.tx_status.setObjectName("txStatus")
+        self.tx_status.setProperty("txState", "ok")
         layout.addWidget(self.tx_status)
 
         return footer
@@ -797,45 +1030,50 @@ class CommanderWindow(QMainWindow):
         self.log_status(f"> {cmd}", "COMMAND")
         self.command_history.append(cmd)
 
-        # Get selected priority
-        priority = PRIORITIES[self.priority_group.checkedId()] if self.priority_group.checkedId() >= 0 else "ROUTINE"
+        priority = self._current_priority
 
         # Parse command
-        if cmd.startswith("/mode"):
-            parts = cmd.split()
-            if len(parts) > 1:
-                mode = parts[1].upper()
-                if mode in [MODE_TCP, MODE_RADIO, MODE_FM, MODE_INTERNET]:
-                    self.mode_combo.setCurrentText(mode)
-                    self.log_status(f"MODE SET: {mode}", "SUCCESS")
-                else:
-                    self.log_status(f"INVALID MODE: {mode}", "ERROR")
-            else:
-                self.log_status("USAGE: /mode <tcp|radio|fm|internet>", "WARNING")
-
-        elif cmd.startswith("/all"):
-            msg = cmd[5:].strip()
-            if msg:
-                self.tx_engine.send_order(msg, "ALL", priority)
-            else:
-                self.log_status("USAGE: /all <message>", "WARNING")
-
-        elif cmd.startswith("/to"):
-            parts = cmd.split(maxsplit=2)
-            if len(parts) >= 3:
-                target = parts[1].upper()
-                msg = parts[2]
-                self.tx_engine.send_order(msg, target, priority)
-            else:
-                self.log_status("USAGE: /to <unit> <message>", "WARNING")
-
+        head, _, rest = cmd.partition(" ")
+        handler = self._cmd_handlers.get(head)
+        if handler:
+            handler(rest.strip(), priority)
         elif cmd.startswith("/"):
-            self.log_status(f"UNKNOWN COMMAND: {cmd.split()[0]}", "ERROR")
-
+            self.log_status(f"UNKNOWN COMMAND: {head}", "ERROR")
         else:
             # Treat as broadcast message
             self.tx_engine.send_order(cmd, "ALL", priority)
 
+    def _cmd_mode(self, args, priority):
+        parts = args.split()
+        if parts:
+            mode = parts[0].upper()
+            if mode in [MODE_TCP, MODE_RADIO, MODE_FM, MODE_INTERNET]:
+                self.mode_combo.setCurrentText(mode)
+                self.log_status(f"MODE SET: {mode}", "SUCCESS")
+            else:
+                self.log_status(f"INVALID MODE: {mode}", "ERROR")
+        else:
+            self.log_status("USAGE: /mode <tcp|radio|fm|internet>", "WARNING")
+
+    def _cmd_all(self, args, priority):
+        if args:
+            self.tx_engine.send_order(args, "ALL", priority)
+        else:
+            self.log_status("USAGE: /all <message>", "WARNING")
+
+    def _cmd_to(self, args, priority):
+        parts = args.split(maxsplit=1)
+        if len(parts) == 2:
+            target = parts[0].upper()
+            msg = parts[1]
+            self.tx_engine.send_order(msg, target, priority)
+        else:
+            self.log_status("USAGE: /to <unit> <message>", "WARNING")
+
+    def _on_priority(self, button_id, checked):
+        if checked:
+            self._current_priority = PRIORITIES[button_id]
+
     def on_mode_change(self, mode):
         self.tx_engine.set_mode(mode)
 
@@ -848,18 +1086,28 @@ class CommanderWindow(QMainWindow):
             self.log_status(f"TX COMPLETE: {details}", "SUCCESS")
             self.tx_counter.setText(str(self.tx_engine.orders_sent))
             self.tx_status.setText("TX SUCCESS")
-            self.tx_status.setStyleSheet(f"color: {Colors.GREEN}; font-size: 9pt; font-weight: bold;")
+            self._set_tx_state("ok")
         else:
             self.log_status(f"TX FAILED: {details}", "ERROR")
             self.tx_status.setText("TX FAILED")
-            self.tx_status.setStyleSheet(f"color: {Colors.RED}; font-size: 9pt; font-weight: bold;")
+            self._set_tx_state("fail")
+
+    def _set_tx_state(self, state):
+        # Swap the QSS-matched property and re-polish only on a transition
+        if self.tx_status.property("txState") != state:
+            self.tx_status.setProperty("txState", state)
+            style = self.tx_status.style()
+            style.unpolish(self.tx_status)
+            style.polish(self.tx_status)
 
     def log_status(self, text, level="INFO"):
         self.log_view.log(text, level)
 
     def update_clock(self):
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.clock_label.setText(now)
+        if now != self._last_clock:
+            self._last_clock = now
+            self.clock_label.setText(now)
 
 
 # =============================================================================
@@ -0,0 +1,483 @@
+"""
+MILCODEC ENGINE v2.0 - HEADLESS STEGANOGRAPHY CORE
+===================================================
+Encryption, DSSS embed/extract and WAV I/O shared by the Studio window and
+the batch encoder. Imports no Qt, so headless tools and worker processes
+can load it on machines without PyQt6.
+"""
+
+import os
+import math
+import numpy as np
+import wave
+from functools import lru_cache
+
+# Cryptography
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+    import base64
+    CRYPTO_AVAILABLE = True
+except ImportError:
+    CRYPTO_AVAILABLE = False
+
+# Optional JIT for the extraction kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# DSSS Masker
+try:
+    from milcodec_masker import DSSSMasker, PNC_KEY, SAMPLE_RATE
+except ImportError:
+    SAMPLE_RATE = 44100
+    PNC_KEY = np.array([
+        1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 0, 1, 1, 1, 0, 1,
+        0, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 0, 0
+    ], dtype=np.float32) * 2 - 1
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+VERSION = "2.0.0"
+MAGIC_HEADER = b"MILCODEC_V2"  # 11 bytes
+DEFAULT_SNR = -20  # dB
+CARRIER_FREQ = 12000  # Hz
+CHIP_DURATION = 0.001  # 1ms per chip
+
+# =============================================================================
+# CRYPTO HELPER
+# =============================================================================
+class CryptoHelper:
+    """Encryption/Decryption utilities for messages."""
+    
+    # Salt for every message encrypted this session, so repeated encodes
+    # with one password derive its key once; rotated by forget_keys()
+    _session_salt = os.urandom(16)
+    
+    @staticmethod
+    def derive_key(password: str, salt: bytes = None) -> tuple:
+        """Derive a 32-byte key from password using PBKDF2."""
+        if salt is None:
+            salt = os.urandom(16)
+        
+        if not CRYPTO_AVAILABLE:
+            # Fallback: simple XOR key
+            key = (password * 32)[:32].encode('utf-8')
+            return key, salt
+            
+        return CryptoHelper._pbkdf2(password, salt), salt
+
+    @staticmethod
+    def _pbkdf2(password: str, salt: bytes) -> bytes:
+        """100k-iteration PBKDF2-HMAC-SHA256 of password."""
+        kdf = PBKDF2HMAC(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=100000,
+            backend=default_backend()
+        )
+        return kdf.derive(password.encode('utf-8'))
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _derive_cached(password: str, salt: bytes) -> bytes:
+        """
+        Memoised _pbkdf2.
+        
+        Encryption uses the session salt and every message from one sender
+        reuses its salt, so repeated encrypts and decrypts skip the key
+        stretching.
+        """
+        return CryptoHelper._pbkdf2(password, salt)
+
+    @staticmethod
+    def forget_keys():
+        """Drop every cached derived key and start a new session salt."""
+        CryptoHelper._derive_cached.cache_clear()
+        CryptoHelper._session_salt = os.urandom(16)
+
+    @staticmethod
+    def encrypt(plaintext: str, password: str) -> bytes:
+        """Encrypt plaintext with ChaCha20-Poly1305 (OpenSSL AEAD)."""
+        salt = CryptoHelper._session_salt
+        nonce = os.urandom(12)
+        
+        if not CRYPTO_AVAILABLE:
+            # Simple XOR fallback
+            key, _ = CryptoHelper.derive_key(password, salt)
+            data = plaintext.encode('utf-8')
+            encrypted = bytes([b ^ key[i % len(key)] for i, b in enumerate(data)])
+            return MAGIC_HEADER + salt + nonce + encrypted
+        
+        key = CryptoHelper._derive_cached(password, salt)
+        ciphertext = ChaCha20Poly1305(key).encrypt(nonce, plaintext.encode('utf-8'), None)
+        
+        # Format: MAGIC + SALT(16) + NONCE(12) + CIPHERTEXT + TAG(16)
+        return MAGIC_HEADER + salt + nonce + ciphertext
+
+    @staticmethod
+    def decrypt(encrypted: bytes, password: str) -> str:
+        """Decrypt ciphertext back to plaintext."""
+        if not encrypted.startswith(MAGIC_HEADER):
+            raise ValueError("Invalid Milcodec encrypted data")
+        
+        data = encrypted[len(MAGIC_HEADER):]
+        salt = data[:16]
+        nonce = data[16:28]
+        ciphertext = data[28:]
+        
+        if not CRYPTO_AVAILABLE:
+            # XOR fallback
+            key, _ = CryptoHelper.derive_key(password, salt)
+            decrypted = bytes([b ^ key[i % len(key)] for i, b in enumerate(ciphertext)])
+            return decrypted.decode('utf-8')
+        
+        key = CryptoHelper._derive_cached(password, salt)
+        try:
+            plaintext = ChaCha20Poly1305(key).decrypt(nonce, ciphertext, None)
+        except InvalidTag:
+            # Wrong password or corrupted audio; the UI treats ValueError
+            # as a failed decryption
+            raise ValueError("Authentication failed") from None
+        
+        return plaintext.decode('utf-8')
+
+
+# =============================================================================
+# AUDIO STEGANOGRAPHY ENGINE
+# =============================================================================
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _correlate_bits(audio, carrier, template, offset, out):
+        """
+        Fused demodulate + matched filter, one bit period per iteration.
+        
+        carrier is one carrier period, indexed modulo its length, so no
+        demodulated copy of audio is made. audio starts at sample offset
+        of the stego signal. Writes one correlation per bit.
+        
+        Deliberately serial: this runs on the StegoWorker QThread, and a
+        parallel=True kernel launched off the main thread leaves numba's
+        thread pool blocking interpreter exit. A full frame is ~3M MACs,
+        a few milliseconds without it.
+        """
+        pn_samples = template.shape[0]
+        period = carrier.shape[0]
+        for b in range(out.shape[0]):
+            base = b * pn_samples
+            acc = 0.0
+            for k in range(pn_samples):
+                i = base + k
+                acc += audio[i] * carrier[(offset + i) % period] * template[k]
+            out[b] = acc
+
+
+class SteganographyEngine:
+    """Engine for hiding data in audio files using DSSS."""
+    
+    def __init__(self):
+        self.snr_db = DEFAULT_SNR
+        self._carrier_tables = {}
+        self._carrier_tiles = {}
+        self._chip_tables = {}
+        self._work = None
+        
+    def set_snr(self, snr_db):
+        """Set the signal-to-noise ratio for embedding."""
+        self.snr_db = max(-30, min(-10, snr_db))
+
+    def _carrier_period(self, sample_rate: int) -> np.ndarray:
+        """
+        Return one exact period of the sampled carrier wave.
+        
+        The sampled carrier repeats every sample_rate / gcd(sample_rate,
+        CARRIER_FREQ) samples (147 at 44.1kHz), so one period is computed
+        once per sample rate.
+        """
+        table = self._carrier_tables.get(sample_rate)
+        if table is None:
+            period = sample_rate // math.gcd(sample_rate, CARRIER_FREQ)
+            table = np.sin(
+                2 * np.pi * CARRIER_FREQ * np.arange(period) / sample_rate
+            ).astype(np.float32)
+            table.flags.writeable = False
+            self._carrier_tables[sample_rate] = table
+        return table
+
+    def _carrier(self, n: int, sample_rate: int) -> np.ndarray:
+        """
+        Return n samples of the carrier wave, starting at phase zero.
+        
+        Every carrier starts at phase zero, so the longest one tiled so far
+        is kept and shorter requests get a read-only prefix view of it.
+        """
+        tiled = self._carrier_tiles.get(sample_rate)
+        if tiled is None or len(tiled) < n:
+            tiled = np.resize(self._carrier_period(sample_rate), n)
+            tiled.flags.writeable = False
+            self._carrier_tiles[sample_rate] = tiled
+        return tiled[:n]
+
+    def _work_buffer(self, n: int) -> np.ndarray:
+        """
+        Return an n-sample float32 scratch buffer, grown on demand.
+        
+        Only for intermediates that never leave the engine; the contents
+        are overwritten by the next embed/extract.
+        """
+        if self._work is None or len(self._work) < n:
+            self._work = np.empty(n, dtype=np.float32)
+        return self._work[:n]
+
+    def _chip_table(self, sample_rate: int) -> np.ndarray:
+        """
+        Return the chip-rate PN waveforms for a 0 bit and a 1 bit.
+        
+        Row 0 is -PN and row 1 is +PN, each chip repeated for one chip
+        duration, so spreading a bit is a row lookup. Cached per sample rate.
+        """
+        table = self._chip_tables.get(sample_rate)
+        if table is None:
+            samples_per_chip = int(sample_rate * CHIP_DURATION)
+            chips = np.repeat(PNC_KEY.astype(np.float32), samples_per_chip)
+            table = np.stack([-chips, chips])
+            table.flags.writeable = False
+            self._chip_tables[sample_rate] = table
+        return table
+
+    def embed_in_audio(self, carrier_audio: np.ndarray, message_bytes: bytes, 
+                       sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+        """
+        Embed encrypted message into carrier audio using DSSS.
+        
+        Args:
+            carrier_audio: Original audio as float32 array
+            message_bytes: Encrypted message bytes
+            sample_rate: Audio sample rate
+            
+        Returns:
+            Modified audio with embedded message
+        """
+        # Add length header to message
+        length_bytes = len(message_bytes).to_bytes(4, 'big')
+        full_message = length_bytes + message_bytes
+        
+        # Convert bytes to bits (MSB first)
+        bits = np.unpackbits(np.frombuffer(full_message, dtype=np.uint8))
+        
+        # Spread each bit with PN code, already upsampled to audio rate:
+        # every bit selects the -PN or +PN row of the chip table
+        table = self._chip_table(sample_rate)
+        baseband = self._work_buffer(len(bits) * table.shape[1])
+        table.take(bits, axis=0, out=baseband.reshape(len(bits), -1), mode='clip')
+        
+        # Modulate onto 12kHz carrier (in place in the scratch buffer)
+        modulated = baseband
+        modulated *= self._carrier(len(baseband), sample_rate)
+        
+        # Calculate mixing ratio based on SNR
+        # SNR = 10 * log10(signal_power / noise_power)
+        # For -20dB: signal_power = noise_power / 100
+        snr_linear = 10 ** (self.snr_db / 10)
+        signal_amplitude = np.sqrt(snr_linear) * 0.5  # Relative to carrier
+        
+        # Ensure message fits in carrier
+        if len(modulated) > len(carrier_audio):
+            # Truncate message (or could loop carrier)
+            modulated = modulated[:len(carrier_audio)]
+        
+        # Create output: the one carrier-length allocation, accumulated into
+        # in place (modulated is scratch, so scale it there)
+        output = np.array(carrier_audio, dtype=np.float32)
+        modulated *= np.float32(signal_amplitude)
+        output[:len(modulated)] += modulated
+        
+        # Normalize to prevent clipping
+        max_val = float(max(output.max(), -output.min())) if len(output) else 0.0
+        if max_val > 1.0:
+            output *= np.float32(0.99 / max_val)
+        
+        return output
+
+    def min_frame_samples(self, sample_rate: int = SAMPLE_RATE) -> int:
+        """
+        Shortest audio that can carry a CryptoHelper payload.
+        
+        The 32-bit length plus MAGIC + SALT(16) + NONCE(12) + TAG(16), one
+        bit period per bit; anything shorter cannot hold a message. The XOR
+        fallback (no cryptography) writes no Poly1305 tag.
+        """
+        tag_len = 16 if CRYPTO_AVAILABLE else 0
+        n_bits = 32 + 8 * (len(MAGIC_HEADER) + 16 + 12 + tag_len)
+        return n_bits * self._chip_table(sample_rate).shape[1]
+
+    def max_frame_samples(self, sample_rate: int = SAMPLE_RATE) -> int:
+        """Longest prefix extract_from_audio ever reads (header + 256 bytes)."""
+        n_bits = 32 + 8 * 256
+        return n_bits * self._chip_table(sample_rate).shape[1]
+
+    def extract_from_audio(self, stego_audio: np.ndarray, 
+                           sample_rate: int = SAMPLE_RATE) -> bytes:
+        """
+        Extract embedded message from audio using DSSS correlation.
+        
+        Args:
+            stego_audio: Audio with embedded message
+            sample_rate: Audio sample rate
+            
+        Returns:
+            Extracted message bytes
+        """
+        pn_samples = self._chip_table(sample_rate).shape[1]
+        
+        # Length (4 bytes = 32 bits) plus a max 256 byte message
+        max_bits = 32 + 8 * 256
+        n_bits = min(max_bits, len(stego_audio) // pn_samples)
+        if n_bits < 32:
+            return b""
+        
+        # Decode the length header first, then only the bit periods the
+        # message actually occupies
+        header = self._decode_bits(stego_audio, sample_rate, 0, 32)
+        message_length = int.from_bytes(header, 'big')
+        n_message_bits = min(8 * message_length, ((n_bits - 32) // 8) * 8)
+        
+        return self._decode_bits(stego_audio, sample_rate, 32, n_message_bits)
+    
+    def _decode_bits(self, stego_audio: np.ndarray, sample_rate: int,
+                     first_bit: int, n_bits: int) -> bytes:
+        """Correlate n_bits bit periods from first_bit and pack them (MSB first)."""
+        template = self._chip_table(sample_rate)[1]
+        pn_samples = len(template)
+        start = first_bit * pn_samples
+        end = start + n_bits * pn_samples
+        
+        if NUMBA_AVAILABLE:
+            audio = np.ascontiguousarray(stego_audio[start:end],
+                                         dtype=np.float32)
+            correlations = np.empty(n_bits, dtype=np.float32)
+            _correlate_bits(audio, self._carrier_period(sample_rate),
+                            template, start, correlations)
+        else:
+            # Demodulate: multiply by carrier (only the bit periods we decode)
+            demodulated = self._work_buffer(end - start)
+            np.multiply(stego_audio[start:end],
+                        self._carrier(end, sample_rate)[start:],
+                        out=demodulated)
+            
+            # Correlation-based detection: correlate every bit period with
+            # the chip-rate PN waveform at once (summing each chip's samples
+            # is the chip average up to a positive scale, so the sign is
+            # unchanged)
+            correlations = demodulated.reshape(n_bits, pn_samples) @ template
+        
+        return np.packbits(correlations > 0).tobytes()
+
+
+# =============================================================================
+# AUDIO FILE HANDLER
+# =============================================================================
+class AudioHandler:
+    """Load and save audio files."""
+    
+    @staticmethod
+    def load_wav(filepath: str) -> tuple:
+        """Load WAV file and return (audio_data, sample_rate, channels)."""
+        with wave.open(filepath, 'r') as wf:
+            channels = wf.getnchannels()
+            sample_rate = wf.getframerate()
+            n_frames = wf.getnframes()
+            sample_width = wf.getsampwidth()
+            
+            raw_data = wf.readframes(n_frames)
+            
+            # Convert to numpy array
+            if sample_width == 1:
+                dtype = np.uint8
+                max_val = 255
+            elif sample_width == 2:
+                dtype = np.int16
+                max_val = 32767
+            else:
+                dtype = np.int32
+                max_val = 2147483647
+            
+            # Convert and scale in one pass straight from the PCM buffer,
+            # into a single float32 output
+            raw = np.frombuffer(raw_data, dtype=dtype)
+            if channels == 2:
+                # Downmix stereo to mono while converting
+                audio = np.add(raw[0::2], raw[1::2], dtype=np.float32)
+                audio *= np.float32(0.5 / max_val)
+            else:
+                audio = np.divide(raw, np.float32(max_val), dtype=np.float32)
+            
+            return audio, sample_rate, channels
+
+    @staticmethod
+    def read_wav_head(filepath: str, max_frames: int):
+        """
+        Read at most max_frames samples of a 16-bit mono WAV (the format
+        save_wav writes) as raw int16, without converting the rest.
+        
+        Returns (samples, sample_rate), or None for any other format. The
+        file is closed on return; a header that overstates the frame count
+        yields the samples actually present.
+        """
+        with open(filepath, 'rb') as f:
+            with wave.open(f) as wf:
+                if wf.getnchannels() != 1 or wf.getsampwidth() != 2:
+                    return None
+                sample_rate = wf.getframerate()
+                n_frames = wf.getnframes()
+                # wave stops reading at the start of the data chunk
+                offset = f.tell()
+        
+        available = max(0, os.path.getsize(filepath) - offset) // 2
+        count = min(n_frames, available, max_frames)
+        samples = np.fromfile(filepath, dtype='<i2', count=count, offset=offset)
+        return samples, sample_rate
+
+    @staticmethod
+    def save_wav(filepath: str, audio: np.ndarray, sample_rate: int = SAMPLE_RATE):
+        """Save audio data to WAV file."""
+        # Normalize and convert to int16, scaling once in a float32 buffer
+        max_val = float(max(audio.max(), -audio.min())) if len(audio) else 0.0
+        gain = np.float32(0.99 * 32767 / max_val if max_val > 0 else 32767)
+        
+        scaled = np.multiply(audio, gain, dtype=np.float32)
+        audio_int = scaled.astype(np.int16)
+        
+        with wave.open(filepath, 'w') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(sample_rate)
+            wf.writeframes(audio_int.tobytes())
+
+
+# =============================================================================
+# HEADLESS PIPELINE
+# =============================================================================
+def encode_file(in_path: str, out_path: str, message: str, password: str,
+                snr_db: float = DEFAULT_SNR) -> str:
+    """
+    Encrypt message and embed it in a WAV carrier without the GUI.
+    
+    Same pipeline as the encode tab; used by milcodec_batch.py.
+    """
+    carrier_audio, sample_rate, _ = AudioHandler.load_wav(in_path)
+    
+    engine = SteganographyEngine()
+    engine.set_snr(snr_db)
+    encrypted = CryptoHelper.encrypt(message, password)
+    stego = engine.embed_in_audio(carrier_audio, encrypted, sample_rate)
+    
+    AudioHandler.save_wav(out_path, stego, sample_rate)
+    return out_path
@@ -5,6 +5,8 @@ Professional Direct Sequence Spread Spectrum signal generator.
 Supports -10dB to -30dB noise floor masking for covert transmission.
 """
 
+import math
+from fractions import Fraction
 import numpy as np
 import wave
 import time
@@ -12,6 +14,13 @@ import argparse
 import sys
 import os
 
+# Optional JIT for the extraction kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -19,15 +28,84 @@ VERSION = "2.0.0"
 SAMPLE_RATE = 44100
 CARRIER_FREQ = 12000  # 12kHz carrier
 
-# 31-bit Barker-like M-sequence for maximum autocorrelation properties
+# 31-bit Barker-like M-sequence for maximum autocorrelation properties.
+# Chips are +/-1, so int8 holds them exactly at a quarter of float32's size.
 PNC_KEY = np.array([
     1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 0, 1, 1, 1, 0, 1,
     0, 1, 0, 0, 0, 0, 1, 0, 0, 1, 0, 1, 1, 0, 0
-], dtype=np.float32) * 2 - 1
+], dtype=np.int8) * 2 - 1
+
+# float32 copy for correlation, so the matched filter never upcasts per call
+_PNC_F32 = PNC_KEY.astype(np.float32)
 
 SPREADING_FACTOR = len(PNC_KEY)  # 31
 CHIP_DURATION = 0.001  # 1ms per chip
 DATA_RATE = 1000 / SPREADING_FACTOR  # ~32 bps
+SAMPLES_PER_CHIP = int(SAMPLE_RATE * CHIP_DURATION)  # 44
+PN_SAMPLES = SPREADING_FACTOR * SAMPLES_PER_CHIP  # 1364 samples per bit
+
+# Chip-rate PN waveform for the matched filter (one bit period)
+_PN_TEMPLATE = np.repeat(_PNC_F32, SAMPLES_PER_CHIP)
+_PN_TEMPLATE.flags.writeable = False
+
+# PN chip signs packed MSB-first into the top 31 bits of a uint32
+_PNC_BITS = np.packbits(np.append(PNC_KEY > 0, False)).view('>u4')[0]
+
+
+def carrier_period(carrier_freq: float, sample_rate: int = SAMPLE_RATE):
+    """
+    Return one exact period of a sampled sine carrier, or None if too long.
+    
+    sin(2*pi*f*n/fs) repeats once f*n/fs is an integer, i.e. every
+    fs*q / gcd(fs*q, p) samples for f = p/q (147 for 12kHz at 44.1kHz),
+    so any length of carrier is this table tiled.
+    """
+    freq = Fraction(carrier_freq)
+    scaled_rate = sample_rate * freq.denominator
+    period = scaled_rate // math.gcd(scaled_rate, freq.numerator)
+    if period > sample_rate:
+        return None
+    
+    table = np.sin(
+        2 * np.pi * float(carrier_freq) * np.arange(period) / sample_rate
+    ).astype(np.float32)
+    table.flags.writeable = False
+    return table
+
+
+def _popcount32(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each uint32 word."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    # NumPy < 2.0
+    return np.unpackbits(words.view(np.uint8).reshape(-1, 4), axis=1).sum(axis=1)
+
+
+def _peak(audio: np.ndarray) -> float:
+    """Peak absolute amplitude, without materialising np.abs(audio)."""
+    if len(audio) == 0:
+        return 0.0
+    return float(max(audio.max(), -audio.min()))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _extract_kernel(audio, carrier, template, num_bits, out):
+        """
+        Fused demodulate + matched filter + decide, one bit per thread.
+        
+        carrier is either one carrier period (indexed modulo its length) or
+        the full-length carrier; no demodulated copy of audio is made.
+        """
+        period = carrier.shape[0]
+        for b in prange(num_bits):
+            base = b * PN_SAMPLES
+            acc = 0.0
+            for k in range(PN_SAMPLES):
+                i = base + k
+                acc += audio[i] * carrier[i % period] * template[k]
+            out[b] = 1 if acc > 0 else 0
+
 
 # =============================================================================
 # DSSS MASKER CLASS
@@ -52,13 +130,21 @@ class DSSSMasker:
             carrier_freq: Carrier frequency in Hz (default 12kHz)
         """
         self.snr_db = max(-30, min(-10, snr_db))
-        self.carrier_freq = carrier_freq
         self.sample_rate = SAMPLE_RATE
+        self.set_carrier_freq(carrier_freq)
+        self._rng = np.random.default_rng()
+        self._noise_buf = None
         
     def set_snr(self, snr_db: float):
         """Set the target SNR for masking."""
         self.snr_db = max(-30, min(-10, snr_db))
 
+    def set_carrier_freq(self, carrier_freq: float):
+        """Set the carrier frequency and rebuild the carrier tables."""
+        self.carrier_freq = carrier_freq
+        self._carrier_period = carrier_period(carrier_freq, self.sample_rate)
+        self._carrier_cache = {}
+
     def generate_masked_audio(self, payload_bytes: bytes) -> np.ndarray:
         """
         Generate DSSS-masked audio signal from payload bytes.
@@ -90,7 +176,7 @@ class DSSSMasker:
         masked = self._apply_noise_masking(modulated)
         
         print(f"[MASKER] Generated {len(masked)} samples ({len(masked)/self.sample_rate:.2f}s)")
-        return masked.astype(np.float32)
+        return masked.astype(np.float32, copy=False)
 
     def generate_with_carrier(self, payload_bytes: bytes, 
                                carrier_audio: np.ndarray) -> np.ndarray:
@@ -104,116 +190,139 @@ class DSSSMasker:
         Returns:
             Modified audio with embedded message
         """
+        # The only carrier-length allocation: a float32 copy of the carrier
+        # that everything below is accumulated into
+        output = np.array(carrier_audio, dtype=np.float32)
+        
         # Generate the modulated signal
         bits = self._bytes_to_bits(payload_bytes)
         spread_signal = self._spread_bits(bits)
         modulated = self._modulate_signal(spread_signal)
         
         # Calculate signal amplitude based on SNR
-        carrier_power = np.mean(carrier_audio ** 2)
+        carrier_power = np.dot(output, output) / output.size
         snr_linear = 10 ** (self.snr_db / 10)
         signal_amplitude = np.sqrt(carrier_power * snr_linear)
         
         # Ensure modulated signal fits in carrier
-        if len(modulated) > len(carrier_audio):
-            modulated = modulated[:len(carrier_audio)]
+        n = min(len(modulated), len(output))
         
         # Add signal to carrier
-        output = carrier_audio.copy()
-        output[:len(modulated)] += modulated * signal_amplitude
+        modulated = modulated[:n]
+        modulated *= np.float32(signal_amplitude)
+        output[:n] += modulated
         
         # Normalize to prevent clipping
-        max_val = np.max(np.abs(output))
+        max_val = _peak(output)
         if max_val > 1.0:
-            output = output / max_val * 0.99
+            output *= np.float32(0.99 / max_val)
         
-        return output.astype(np.float32)
+        return output
 
-    def extract_from_audio(self, audio: np.ndarray) -> bytes:
+    def extract_from_audio(self, audio: np.ndarray,
+                           hard_decision: bool = False) -> bytes:
         """
         Extract embedded message from DSSS audio signal.
         
         Args:
             audio: Audio signal with embedded message
+            hard_decision: Slice each chip to its sign and decide bits by
+                XOR/popcount against the PN code. Cheaper, but gives up
+                the soft-combining gain, so only use it at high SNR.
             
         Returns:
             Extracted payload bytes
         """
-        samples_per_chip = int(self.sample_rate * CHIP_DURATION)
+        audio = np.asarray(audio, dtype=np.float32)
         
-        # Demodulate: multiply by carrier
-        t = np.linspace(0, len(audio) / self.sample_rate, len(audio))
-        carrier = np.sin(2 * np.pi * self.carrier_freq * t)
-        demodulated = audio * carrier
+        # Extract up to 4096 bits (512 bytes max message)
+        max_bits = 4096
+        num_bits = min(max_bits, len(audio) // PN_SAMPLES)
+        span = num_bits * PN_SAMPLES
         
-        # Low-pass filter (simple averaging)
-        # TODO: Implement proper matched filter for better performance
+        if hard_decision:
+            return self._bits_to_bytes(self._hard_decide(audio, num_bits))
         
-        # Correlation-based bit detection
-        pn_samples = SPREADING_FACTOR * samples_per_chip
-        extracted_bits = []
-        position = 0
+        if NUMBA_AVAILABLE:
+            carrier = self._carrier_period
+            if carrier is None:
+                carrier = self._carrier(span)
+            extracted_bits = np.empty(num_bits, dtype=np.uint8)
+            _extract_kernel(audio, carrier, _PN_TEMPLATE, num_bits,
+                            extracted_bits)
+            return self._bits_to_bytes(extracted_bits)
         
-        # Extract up to 4096 bits (512 bytes max message)
-        max_bits = 4096
+        # Demodulate: multiply by carrier
+        demodulated = audio[:span] * self._carrier(span)
         
-        while position + pn_samples <= len(demodulated) and len(extracted_bits) < max_bits:
-            chunk = demodulated[position:position + pn_samples]
-            
-            # Downsample to chip rate
-            chips = np.array([
-                np.mean(chunk[i * samples_per_chip:(i + 1) * samples_per_chip])
-                for i in range(SPREADING_FACTOR)
-            ])
-            
-            # Correlate with PN code
-            correlation = np.sum(chips * PNC_KEY)
-            bit = 1 if correlation > 0 else 0
-            extracted_bits.append(bit)
-            
-            position += pn_samples
+        # Matched filter: correlate each bit period with the chip-rate PN
+        # waveform. Only the lags on bit boundaries are needed, so this is
+        # one (bits x PN_SAMPLES) @ (PN_SAMPLES,) product rather than a full
+        # sliding correlation.
+        correlation = demodulated.reshape(num_bits, PN_SAMPLES) @ _PN_TEMPLATE
+        extracted_bits = (correlation > 0).astype(np.uint8)
         
         # Convert bits to bytes
         return self._bits_to_bytes(extracted_bits)
 
-    def _bytes_to_bits(self, data: bytes) -> list:
-        """Convert bytes to list of bits."""
-        bits = []
-        for byte in data:
-            for i in range(8):
-                bits.append((byte >> (7 - i)) & 1)
-        return bits
-
-    def _bits_to_bytes(self, bits: list) -> bytes:
-        """Convert list of bits back to bytes."""
-        byte_list = []
-        for i in range(0, len(bits), 8):
-            if i + 8 > len(bits):
-                break
-            byte_bits = bits[i:i + 8]
-            byte_val = sum(b << (7 - j) for j, b in enumerate(byte_bits))
-            byte_list.append(byte_val)
-        return bytes(byte_list)
-
-    def _spread_bits(self, bits: list) -> np.ndarray:
+    def _hard_decide(self, audio: np.ndarray, num_bits: int) -> np.ndarray:
+        """Decide bits from chip signs: 1 if at most 15 of 31 chips disagree."""
+        span = num_bits * PN_SAMPLES
+        demodulated = audio[:span] * self._carrier(span)
+        chips = demodulated.reshape(
+            num_bits, SPREADING_FACTOR, SAMPLES_PER_CHIP
+        ).sum(axis=2)
+        
+        # Pack each bit's 31 chip signs (plus a zero pad bit) into a uint32
+        signs = np.zeros((num_bits, 32), dtype=bool)
+        np.greater(chips, 0, out=signs[:, :SPREADING_FACTOR])
+        words = np.packbits(signs, axis=1).view('>u4').ravel()
+        
+        mismatches = _popcount32(words ^ _PNC_BITS)
+        return (mismatches <= SPREADING_FACTOR // 2).astype(np.uint8)
+
+    def _bytes_to_bits(self, data: bytes) -> np.ndarray:
+        """Convert bytes to an array of bits (MSB first)."""
+        return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+
+    def _bits_to_bytes(self, bits) -> bytes:
+        """Convert bits back to bytes, dropping any trailing partial byte."""
+        whole = (len(bits) // 8) * 8
+        return np.packbits(np.asarray(bits[:whole], dtype=np.uint8)).tobytes()
+
+    def _spread_bits(self, bits: np.ndarray) -> np.ndarray:
         """Apply PN code spreading to bits."""
-        spread_seq = []
-        for bit in bits:
-            scalar = 1 if bit == 1 else -1
-            spread_seq.extend(PNC_KEY * scalar)
-        return np.array(spread_seq, dtype=np.float32)
+        # Map 0/1 -> -1/+1 arithmetically (2b - 1) and expand every bit to a
+        # full PN sequence at once; the +/-1 chips are exact in int8
+        symbols = (np.asarray(bits).astype(np.int8) << 1) - 1
+        return np.multiply.outer(symbols, PNC_KEY).astype(np.float32).ravel()
 
     def _modulate_signal(self, spread_signal: np.ndarray) -> np.ndarray:
         """Upsample and modulate onto carrier frequency (BPSK)."""
-        samples_per_chip = int(self.sample_rate * CHIP_DURATION)
-        baseband = np.repeat(spread_signal, samples_per_chip)
-        
-        # Generate carrier wave
-        t = np.linspace(0, len(baseband) / self.sample_rate, len(baseband))
-        carrier = np.sin(2 * np.pi * self.carrier_freq * t)
+        carrier = self._carrier(len(spread_signal) * SAMPLES_PER_CHIP)
         
-        # BPSK modulation
-        return baseband * carrier
+        # BPSK modulation: broadcast each chip over its samples instead of
+        # materialising the np.repeat baseband first
+        modulated = spread_signal[:, None] * carrier.reshape(-1, SAMPLES_PER_CHIP)
+        return modulated.ravel()
+
+    def _carrier(self, n: int) -> np.ndarray:
+        """Return n samples of the carrier wave, starting at phase zero."""
+        if self._carrier_period is not None:
+            return np.resize(self._carrier_period, n)
+        
+        key = (n, self.carrier_freq, self.sample_rate)
+        carrier = self._carrier_cache.get(key)
+        if carrier is None:
+            # Phase accumulates in float64: float32 cannot resolve the phase
+            # of late samples in a multi-second carrier
+            step = 2 * np.pi * self.carrier_freq / self.sample_rate
+            carrier = np.sin(step * np.arange(n)).astype(np.float32)
+            carrier.flags.writeable = False
+            if len(self._carrier_cache) >= 4:
+                self._carrier_cache.clear()
+            self._carrier_cache[key] = carrier
+        return carrier
 
     def _apply_noise_masking(self, modulated: np.ndarray) -> np.ndarray:
         """Add Gaussian noise at target SNR."""
@@ -228,29 +337,37 @@ class DSSSMasker:
         noise_power = sig_power / snr_linear
         noise_std = np.sqrt(noise_power)
         
-        # Generate noise
-        noise = np.random.normal(0, noise_std, len(modulated))
+        # Refill a reusable float32 buffer with fresh noise each call; the
+        # values are never reused, only the allocation
+        n = len(modulated)
+        if self._noise_buf is None or self._noise_buf.size < n:
+            self._noise_buf = np.empty(n, dtype=np.float32)
+        noise = self._noise_buf[:n]
+        self._rng.standard_normal(dtype=np.float32, out=noise)
+        noise *= np.float32(noise_std)
         
         # For very low SNR, we want signal buried under noise
-        # Mix signal and noise
-        masked = modulated + noise
+        # Mix in place: modulated is a fresh array owned by this pipeline,
+        # and the returned audio must not alias the shared noise buffer
+        masked = modulated
+        masked += noise
         
         # Normalize
-        max_val = np.max(np.abs(masked))
+        max_val = _peak(masked)
         if max_val > 0:
-            masked = masked / max_val * 0.95
+            masked *= np.float32(0.95 / max_val)
         
         return masked
 
     def save_wav(self, audio_data: np.ndarray, filename: str = "output_masked.wav"):
         """Save audio data to WAV file."""
-        max_val = np.max(np.abs(audio_data))
-        if max_val > 0:
-            scaled = audio_data / max_val * 32767
-        else:
-            scaled = audio_data * 32767
+        max_val = _peak(audio_data)
+        gain = np.float32(32767 / max_val if max_val > 0 else 32767)
         
-        scaled = np.int16(scaled)
+        # Scale in a float32 scratch buffer and clip so nothing wraps on cast
+        scratch = np.multiply(audio_data, gain, dtype=np.float32)
+        np.clip(scratch, -32768, 32767, out=scratch)
+        scaled = scratch.astype(np.int16)
         
         with wave.open(filename, 'w') as wf:
             wf.setnchannels(1)
@@ -289,23 +406,22 @@ class SignalAnalyzer:
     @staticmethod
     def compute_fft(audio: np.ndarray, n_bins: int = 256) -> np.ndarray:
         """Compute FFT magnitude spectrum."""
-        fft = np.fft.fft(audio[:4096])
+        # Real input: rfft returns only the non-negative half of the spectrum
+        fft = np.fft.rfft(audio[:4096])
         magnitude = np.abs(fft)[:n_bins]
         return magnitude
 
     @staticmethod
     def detect_carrier(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> float:
         """Detect the carrier frequency in the signal."""
-        fft = np.fft.fft(audio)
-        freqs = np.fft.fftfreq(len(audio), 1/sample_rate)
+        n = len(audio)
+        fft = np.fft.rfft(audio)
         
-        # Find peak in positive frequencies
-        positive_mask = freqs > 0
-        positive_freqs = freqs[positive_mask]
-        positive_mags = np.abs(fft)[positive_mask]
+        # Find peak in positive frequencies (skip DC and the Nyquist bin)
+        positive_mags = np.abs(fft[1:(n + 1) // 2])
         
-        peak_idx = np.argmax(positive_mags)
-        return positive_freqs[peak_idx]
+        peak_idx = np.argmax(positive_mags) + 1
+        return peak_idx * sample_rate / n
 
 
 # =============================================================================
@@ -10,9 +10,9 @@ import os
 import time
 import socket
 import threading
+import math
 import queue
 import numpy as np
-import collections
 import random
 from datetime import datetime
 
@@ -25,11 +25,11 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QThread, pyqtSignal, QTimer, QMutex, QPropertyAnimation,
-    QEasingCurve, QSize
+    QEasingCurve, QSize, QLine, QPointF
 )
 from PyQt6.QtGui import (
     QColor, QPalette, QFont, QPainter, QPen, QBrush, QLinearGradient,
-    QRadialGradient, QPainterPath
+    QRadialGradient, QPainterPath, QPixmap, QPolygonF
 )
 
 # Cryptography Imports
@@ -86,6 +86,18 @@ PRIORITY_COLORS = {
     PRIORITY_ROUTINE: Colors.TEXT_SECONDARY
 }
 
+# Opening markup for each priority's feed line, built once at import
+PRIORITY_PREFIXES = {
+    PRIORITY_FLASH: "⚠ FLASH ▶ ",
+    PRIORITY_IMMEDIATE: "◆ IMMED ▶ ",
+    PRIORITY_PRIORITY: "● PRIOR ▶ ",
+    PRIORITY_ROUTINE: "○ ROUT  ▶ ",
+}
+PRIORITY_HTML = {
+    prio: f'<span style="color: {PRIORITY_COLORS[prio]};">{prefix}'
+    for prio, prefix in PRIORITY_PREFIXES.items()
+}
+
 # =============================================================================
 # CRYPTOGRAPHY ENGINE ("THE SHIELD")
 # =============================================================================
@@ -166,6 +178,7 @@ class SignalProcessor(QThread):
         self.data_queue = queue.Queue()
         self.crypto = CryptoEngine()
         self.source_mode = "SIMULATION"  # SIMULATION, MICROPHONE, FILE, NETWORK
+        self._rng = np.random.default_rng()
         
         # Statistics
         self.packets_received = 0
@@ -212,19 +225,24 @@ class SignalProcessor(QThread):
             ("CMD:ALL:ROUTINE:SUPPLY DROP CONFIRMED GRID REF 45N12E", PRIORITY_ROUTINE),
         ]
 
+        # Per-sample phase of the 440Hz test tone within one buffer
+        tone_phase = 2 * np.pi * 440 * np.arange(BUFFER_SIZE) / SAMPLE_RATE
+
         while self.is_running:
-            # Generate noise floor
-            noise = np.random.normal(0, 0.05, BUFFER_SIZE).astype(np.float32)
+            # Generate noise floor directly in float32. Each buffer is queued
+            # for the processor thread, so it must be a fresh array.
+            noise = self._rng.standard_normal(BUFFER_SIZE, dtype=np.float32)
+            noise *= np.float32(0.05)
 
             # Inject message every 6 seconds
             if time.time() - last_msg_time > 6:
-                t_vec = np.linspace(t, t + BUFFER_SIZE/SAMPLE_RATE, BUFFER_SIZE)
-                carrier = 0.8 * np.sin(2 * np.pi * 440 * t_vec)
-                noise += carrier.astype(np.float32)
+                carrier = np.sin(2 * np.pi * 440 * t + tone_phase)
+                carrier *= 0.8
+                noise += carrier
 
                 if time.time() - last_msg_time > 6.3:
                     last_msg_time = time.time()
-                    msg, priority = test_messages[msg_index % len(test_messages)]
+                    msg, _ = test_messages[msg_index % len(test_messages)]
                     self.data_queue.put(("MSG_TRIGGER", msg))
                     msg_index += 1
 
@@ -306,24 +324,44 @@ class SignalProcessor(QThread):
 # =============================================================================
 class SNRGraph(QFrame):
     """Advanced SNR visualization with gradient fill and grid."""
+    HISTORY_LEN = 150
+
     def __init__(self):
         super().__init__()
         self.setMinimumHeight(120)
-        self.history = collections.deque([0] * 150, maxlen=150)
+        # Ring buffer of recent SNR values; _idx is the next slot to write
+        self._hist = np.zeros(self.HISTORY_LEN, dtype=np.float64)
+        self._idx = 0
         self.setStyleSheet(f"background: transparent; border: none;")
 
+        # Coalesce per-chunk updates into at most one repaint per frame
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(33)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self.update)
+
+        # Grid and threshold line, rebuilt only when the size changes
+        self._bg_pixmap = None
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
     def update_val(self, val):
-        self.history.append(val)
-        self.update()
+        self._hist[self._idx] = val
+        self._idx = (self._idx + 1) % self.HISTORY_LEN
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._bg_pixmap = None
 
+    def _render_background(self):
+        """Render the static layer (grid, threshold line) into a pixmap."""
         w, h = self.width(), self.height()
+        pixmap = QPixmap(self.size())
+        pixmap.fill(QColor(Colors.VOID))
 
-        # Background
-        painter.fillRect(0, 0, w, h, QColor(Colors.VOID))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Grid
         painter.setPen(QPen(QColor(Colors.BORDER_DIM), 1, Qt.PenStyle.DotLine))
@@ -337,24 +375,30 @@ class SNRGraph(QFrame):
         mid_y = h // 2
         painter.drawLine(0, mid_y, w, mid_y)
 
-        # Build path
-        if len(self.history) < 2:
-            return
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._render_background()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        w, h = self.width(), self.height()
 
+        # Oldest to newest
+        vals = np.roll(self._hist, -self._idx)
+        xs = np.arange(self.HISTORY_LEN) * (w / (self.HISTORY_LEN - 1))
+        ys = h - (vals / 100.0 * h)
+
+        # Filled area under the trace, closed along the bottom edge
+        outline = [QPointF(0, h)]
+        outline.extend(map(QPointF, xs.tolist(), ys.tolist()))
+        outline.append(QPointF(w, h))
         path = QPainterPath()
-        step = w / (len(self.history) - 1)
-
-        points = []
-        for i, val in enumerate(self.history):
-            x = i * step
-            y = h - (val / 100.0 * h)
-            points.append((x, y))
-
-        # Start path for fill
-        path.moveTo(0, h)
-        for x, y in points:
-            path.lineTo(x, y)
-        path.lineTo(w, h)
+        path.addPolygon(QPolygonF(outline))
         path.closeSubpath()
 
         # Gradient fill
@@ -364,19 +408,15 @@ class SNRGraph(QFrame):
         painter.fillPath(path, gradient)
 
         # Signal line with glow
+        ix = xs.astype(np.int64).tolist()
+        iy = ys.astype(np.int64).tolist()
         painter.setPen(QPen(QColor(Colors.CYAN), 2))
-        for i in range(len(points) - 1):
-            painter.drawLine(
-                int(points[i][0]), int(points[i][1]),
-                int(points[i + 1][0]), int(points[i + 1][1])
-            )
+        painter.drawLines(list(map(QLine, ix[:-1], iy[:-1], ix[1:], iy[1:])))
 
         # Current value indicator
-        if points:
-            last_x, last_y = points[-1]
-            painter.setBrush(QBrush(QColor(Colors.CYAN)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(int(last_x) - 4, int(last_y) - 4, 8, 8)
+        painter.setBrush(QBrush(QColor(Colors.CYAN)))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawEllipse(int(xs[-1]) - 4, int(ys[-1]) - 4, 8, 8)
 
 
 class WaveformDisplay(QFrame):
@@ -387,9 +427,16 @@ class WaveformDisplay(QFrame):
         self.data = []
         self.setStyleSheet("background: transparent;")
 
+        # Coalesce per-chunk updates into at most one repaint per frame
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(33)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.timeout.connect(self.update)
+
     def set_data(self, data):
         self.data = data
-        self.update()
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
 
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -422,6 +469,13 @@ class WaveformDisplay(QFrame):
 
 class StatusIndicator(QFrame):
     """Animated status dot indicator."""
+    STATUS_COLORS = {
+        'CONNECTED': QColor(Colors.GREEN),
+        'PENDING': QColor(Colors.AMBER),
+        'ERROR': QColor(Colors.RED),
+        'OFFLINE': QColor(Colors.TEXT_DIM),
+    }
+
     def __init__(self, size=10):
         super().__init__()
         self.setFixedSize(size, size)
@@ -433,8 +487,9 @@ class StatusIndicator(QFrame):
         self.timer.start(50)
 
     def set_status(self, status):
-        self.status = status
-        self.update()
+        if status != self.status:
+            self.status = status
+            self.update()
 
     def _animate(self):
         self._pulse = (self._pulse + 5) % 360
@@ -444,17 +499,12 @@ class StatusIndicator(QFrame):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        color_map = {
-            'CONNECTED': Colors.GREEN,
-            'PENDING': Colors.AMBER,
-            'ERROR': Colors.RED,
-            'OFFLINE': Colors.TEXT_DIM,
-        }
-        color = QColor(color_map.get(self.status, Colors.TEXT_DIM))
+        # Copy, since the pulse below changes the alpha
+        color = QColor(self.STATUS_COLORS.get(self.status,
+                                              self.STATUS_COLORS['OFFLINE']))
 
         # Pulse effect for active states
-        if self.status in ['CONNECTED', 'PENDING']:
-            import math
+        if self.status in ('CONNECTED', 'PENDING'):
             alpha = int(128 + 127 * math.sin(math.radians(self._pulse)))
             color.setAlpha(alpha)
 
@@ -481,29 +531,166 @@ class MessageFeed(QTextEdit):
         """)
 
     def add_message(self, text, priority=PRIORITY_ROUTINE):
-        color = PRIORITY_COLORS.get(priority, Colors.TEXT_SECONDARY)
-        prefix = ""
-        if priority == PRIORITY_FLASH:
-            prefix = "⚠ FLASH ▶ "
-        elif priority == PRIORITY_IMMEDIATE:
-            prefix = "◆ IMMED ▶ "
-        elif priority == PRIORITY_PRIORITY:
-            prefix = "● PRIOR ▶ "
-        else:
-            prefix = "○ ROUT  ▶ "
-
-        self.append(f'<span style="color: {color};">{prefix}{text}</span>')
+        opening = PRIORITY_HTML.get(priority, PRIORITY_HTML[PRIORITY_ROUTINE])
+        self.append(opening + text + "</span>")
         self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
 
 
 # =============================================================================
 # MAIN WINDOW ("THE NIGHT WATCH")
 # =============================================================================
+# One stylesheet for the whole window, parsed once. Widgets are matched by
+# object name; state changes flip dynamic properties instead of re-setting
+# a stylesheet.
+WINDOW_QSS = f"""
+    QMainWindow {{
+        background-color: {Colors.BACKGROUND};
+    }}
+    QLabel {{
+        color: {Colors.TEXT_PRIMARY};
+        font-family: 'Inter', 'Segoe UI', sans-serif;
+    }}
+    QLabel#captionLabel {{
+        color: {Colors.TEXT_DIM};
+        font-size: 9pt;
+    }}
+    QFrame#Header {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {Colors.ELEVATED}, stop:1 {Colors.SURFACE});
+        border-bottom: 1px solid {Colors.BORDER};
+    }}
+    QLabel#headerTitle {{
+        font-size: 14pt;
+        font-weight: 600;
+        color: {Colors.CYAN};
+        letter-spacing: 2px;
+    }}
+    QLabel#headerSubtitle {{
+        font-size: 9pt;
+        color: {Colors.TEXT_DIM};
+    }}
+    QLabel#statusLabel {{
+        color: {Colors.TEXT_SECONDARY};
+        font-size: 10pt;
+    }}
+    QLabel#statusLabel[level="CONNECTED"] {{
+        color: {Colors.GREEN};
+    }}
+    QLabel#statusLabel[level="PENDING"] {{
+        color: {Colors.AMBER};
+    }}
+    QLabel#statusLabel[level="ERROR"] {{
+        color: {Colors.RED};
+    }}
+    QLabel#clockLabel {{
+        font-family: 'JetBrains Mono', 'Consolas';
+        font-size: 12pt;
+        color: {Colors.AMBER};
+    }}
+    QFrame#panel, QFrame#panel QFrame {{
+        background-color: {Colors.SURFACE};
+        border: 1px solid {Colors.BORDER_DIM};
+        border-radius: 6px;
+    }}
+    QLabel#panelTitle {{
+        color: {Colors.TEXT_DIM};
+        font-size: 9pt;
+        font-weight: 600;
+        letter-spacing: 1px;
+    }}
+    QFrame#statCard, QFrame#statCard QFrame {{
+        background-color: {Colors.SURFACE};
+        border: 1px solid {Colors.BORDER_DIM};
+        border-radius: 6px;
+        padding: 8px;
+    }}
+    QLabel#cardTitle {{
+        color: {Colors.TEXT_DIM};
+        font-size: 8pt;
+        letter-spacing: 1px;
+    }}
+    QLabel#value {{
+        font-size: 16pt;
+        font-weight: bold;
+    }}
+    QLabel#value[tone="ok"] {{
+        color: {Colors.GREEN};
+    }}
+    QLabel#value[tone="info"] {{
+        color: {Colors.CYAN};
+    }}
+    QLabel#value[tone="neutral"] {{
+        color: {Colors.TEXT_SECONDARY};
+    }}
+    QLabel#value[tone="alert"] {{
+        color: {Colors.RED};
+    }}
+    QFrame#footerPanel, QFrame#footerPanel QFrame {{
+        background-color: {Colors.SURFACE};
+        border-top: 1px solid {Colors.BORDER};
+    }}
+    QComboBox#sourceCombo {{
+        background-color: {Colors.VOID};
+        border: 1px solid {Colors.BORDER};
+        border-radius: 4px;
+        padding: 6px 12px;
+        color: {Colors.TEXT_PRIMARY};
+        min-width: 120px;
+    }}
+    QComboBox#sourceCombo::drop-down {{
+        border: none;
+    }}
+    QComboBox#sourceCombo QAbstractItemView {{
+        background-color: {Colors.SURFACE};
+        border: 1px solid {Colors.BORDER};
+        color: {Colors.TEXT_PRIMARY};
+    }}
+    QPushButton#panicButton {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #2a1a1a, stop:1 #1a0a0a);
+        border: 2px solid {Colors.RED};
+        border-radius: 4px;
+        padding: 10px 24px;
+        color: {Colors.RED};
+        font-weight: bold;
+        font-size: 11pt;
+        letter-spacing: 2px;
+    }}
+    QPushButton#panicButton:hover {{
+        background-color: {Colors.RED};
+        color: {Colors.VOID};
+    }}
+"""
+
+
+def set_label_text(label, text):
+    """Set label text, skipping the relayout when nothing changed."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def set_style_property(widget, name, value):
+    """Set a QSS-matched property, re-polishing only on a change."""
+    if widget.property(name) != value:
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.start_time = time.time()
         self.processor = SignalProcessor()
+
+        # Stats are applied at most every 100ms, whatever rate they arrive at
+        self._pending_stats = None
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(100)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.timeout.connect(self._flush_stats)
+
         self.init_ui()
         self.init_signals()
         self.processor.start()
@@ -511,15 +698,7 @@ class MainWindow(QMainWindow):
     def init_ui(self):
         self.setWindowTitle(f"MILCODEC RECEIVER v{VERSION} - NIGHT WATCH")
         self.setGeometry(100, 100, 900, 750)
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {Colors.BACKGROUND};
-            }}
-            QLabel {{
-                color: {Colors.TEXT_PRIMARY};
-                font-family: 'Inter', 'Segoe UI', sans-serif;
-            }}
-        """)
+        self.setStyleSheet(WINDOW_QSS)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -541,10 +720,10 @@ class MainWindow(QMainWindow):
         cards_row = QHBoxLayout()
         cards_row.setSpacing(12)
 
-        self.card_crypto = self._create_stat_card("CRYPTO STATUS", "OPERATIONAL", Colors.GREEN)
-        self.card_packets = self._create_stat_card("PACKETS RX", "0", Colors.CYAN)
-        self.card_decoded = self._create_stat_card("DECODED", "0", Colors.CYAN)
-        self.card_uptime = self._create_stat_card("UPTIME", "0s", Colors.TEXT_SECONDARY)
+        self.card_crypto = self._create_stat_card("CRYPTO STATUS", "OPERATIONAL", "ok")
+        self.card_packets = self._create_stat_card("PACKETS RX", "0", "info")
+        self.card_decoded = self._create_stat_card("DECODED", "0", "info")
+        self.card_uptime = self._create_stat_card("UPTIME", "0s", "neutral")
 
         cards_row.addWidget(self.card_crypto)
         cards_row.addWidget(self.card_packets)
@@ -562,7 +741,7 @@ class MainWindow(QMainWindow):
 
         wave_row = QHBoxLayout()
         wave_label = QLabel("WAVEFORM")
-        wave_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 9pt;")
+        wave_label.setObjectName("captionLabel")
         wave_row.addWidget(wave_label)
         wave_row.addStretch()
         signal_layout.addLayout(wave_row)
@@ -594,13 +773,6 @@ class MainWindow(QMainWindow):
         header = QFrame()
         header.setObjectName("Header")
         header.setFixedHeight(60)
-        header.setStyleSheet(f"""
-            QFrame#Header {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {Colors.ELEVATED}, stop:1 {Colors.SURFACE});
-                border-bottom: 1px solid {Colors.BORDER};
-            }}
-        """)
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(16, 0, 16, 0)
@@ -610,15 +782,10 @@ class MainWindow(QMainWindow):
         title_col.setSpacing(2)
 
         title = QLabel("MILCODEC RECEIVER")
-        title.setStyleSheet(f"""
-            font-size: 14pt;
-            font-weight: 600;
-            color: {Colors.CYAN};
-            letter-spacing: 2px;
-        """)
+        title.setObjectName("headerTitle")
 
         subtitle = QLabel("NIGHT WATCH TERMINAL • SECURE FIELD UNIT")
-        subtitle.setStyleSheet(f"font-size: 9pt; color: {Colors.TEXT_DIM};")
+        subtitle.setObjectName("headerSubtitle")
 
         title_col.addWidget(title)
         title_col.addWidget(subtitle)
@@ -632,7 +799,7 @@ class MainWindow(QMainWindow):
 
         self.status_indicator = StatusIndicator()
         self.status_label = QLabel("INITIALIZING...")
-        self.status_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; font-size: 10pt;")
+        self.status_label.setObjectName("statusLabel")
 
         status_col.addWidget(self.status_indicator)
         status_col.addWidget(self.status_label)
@@ -642,105 +809,64 @@ class MainWindow(QMainWindow):
 
         # Right: Clock
         self.clock_label = QLabel()
-        self.clock_label.setStyleSheet(f"""
-            font-family: 'JetBrains Mono', 'Consolas';
-            font-size: 12pt;
-            color: {Colors.AMBER};
-        """)
+        self.clock_label.setObjectName("clockLabel")
         layout.addWidget(self.clock_label)
 
         return header
 
     def _create_panel(self, title):
         panel = QFrame()
-        panel.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border: 1px solid {Colors.BORDER_DIM};
-                border-radius: 6px;
-            }}
-        """)
+        panel.setObjectName("panel")
 
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
 
         label = QLabel(title)
-        label.setStyleSheet(f"""
-            color: {Colors.TEXT_DIM};
-            font-size: 9pt;
-            font-weight: 600;
-            letter-spacing: 1px;
-        """)
+        label.setObjectName("panelTitle")
         layout.addWidget(label)
 
         return panel
 
-    def _create_stat_card(self, title, value, color):
+    def _create_stat_card(self, title, value, tone):
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border: 1px solid {Colors.BORDER_DIM};
-                border-radius: 6px;
-                padding: 8px;
-            }}
-        """)
+        card.setObjectName("statCard")
 
         layout = QVBoxLayout(card)
         layout.setSpacing(4)
         layout.setContentsMargins(12, 8, 12, 8)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 8pt; letter-spacing: 1px;")
+        title_label.setObjectName("cardTitle")
 
         value_label = QLabel(value)
         value_label.setObjectName("value")
-        value_label.setStyleSheet(f"color: {color}; font-size: 16pt; font-weight: bold;")
+        value_label.setProperty("tone", tone)
 
         layout.addWidget(title_label)
         layout.addWidget(value_label)
 
+        # Kept on the card so updates skip a findChild() walk
+        card.value_label = value_label
+
         return card
 
     def _create_footer(self):
         footer = QFrame()
+        footer.setObjectName("footerPanel")
         footer.setFixedHeight(60)
-        footer.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.SURFACE};
-                border-top: 1px solid {Colors.BORDER};
-            }}
-        """)
 
         layout = QHBoxLayout(footer)
         layout.setContentsMargins(16, 0, 16, 0)
 
         # Source selector
         source_label = QLabel("INPUT SOURCE:")
-        source_label.setStyleSheet(f"color: {Colors.TEXT_DIM}; font-size: 9pt;")
+        source_label.setObjectName("captionLabel")
         layout.addWidget(source_label)
 
         self.source_combo = QComboBox()
         self.source_combo.addItems(["SIMULATION", "MICROPHONE", "NETWORK", "FILE"])
-        self.source_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {Colors.VOID};
-                border: 1px solid {Colors.BORDER};
-                border-radius: 4px;
-                padding: 6px 12px;
-                color: {Colors.TEXT_PRIMARY};
-                min-width: 120px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {Colors.SURFACE};
-                border: 1px solid {Colors.BORDER};
-                color: {Colors.TEXT_PRIMARY};
-            }}
-        """)
+        self.source_combo.setObjectName("sourceCombo")
         layout.addWidget(self.source_combo)
 
         layout.addStretch()
@@ -748,23 +874,7 @@ class MainWindow(QMainWindow):
         # Panic button
         self.btn_panic = QPushButton("◉  PROTOCOL ZERO  ◉")
         self.btn_panic.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.btn_panic.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2a1a1a, stop:1 #1a0a0a);
-                border: 2px solid {Colors.RED};
-                border-radius: 4px;
-                padding: 10px 24px;
-                color: {Colors.RED};
-                font-weight: bold;
-                font-size: 11pt;
-                letter-spacing: 2px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.RED};
-                color: {Colors.VOID};
-            }}
-        """)
+        self.btn_panic.setObjectName("panicButton")
         self.btn_panic.clicked.connect(self.panic_wipe)
         layout.addWidget(self.btn_panic)
 
@@ -781,30 +891,37 @@ class MainWindow(QMainWindow):
         self.message_feed.add_message(text, priority)
 
     def update_status(self, status, level):
-        self.status_label.setText(status)
+        set_label_text(self.status_label, status)
         self.status_indicator.set_status(level)
         
-        color = {
-            'CONNECTED': Colors.GREEN,
-            'PENDING': Colors.AMBER,
-            'ERROR': Colors.RED,
-        }.get(level, Colors.TEXT_SECONDARY)
-        
-        self.status_label.setStyleSheet(f"color: {color}; font-size: 10pt;")
+        # Colour comes from the window stylesheet's [level=...] rules, so a
+        # new level is one property flip and re-polish, never a re-parse.
+        # (A QPalette swap would be ignored: stylesheet colours win.)
+        set_style_property(self.status_label, "level", level)
 
     def update_stats(self, stats):
-        self.card_packets.findChild(QLabel, "value").setText(str(stats['packets_received']))
-        self.card_decoded.findChild(QLabel, "value").setText(str(stats['packets_decoded']))
-        self.card_uptime.findChild(QLabel, "value").setText(f"{stats['uptime']}s")
+        # Keep only the newest snapshot; the timer applies it
+        self._pending_stats = stats
+        if not self._stats_timer.isActive():
+            self._stats_timer.start()
+
+    def _flush_stats(self):
+        stats, self._pending_stats = self._pending_stats, None
+        if stats is None:
+            return
+
+        set_label_text(self.card_packets.value_label, str(stats['packets_received']))
+        set_label_text(self.card_decoded.value_label, str(stats['packets_decoded']))
+        set_label_text(self.card_uptime.value_label, f"{stats['uptime']}s")
         
-        crypto_color = Colors.GREEN if stats['crypto_status'] == 'OPERATIONAL' else Colors.RED
-        crypto_label = self.card_crypto.findChild(QLabel, "value")
-        crypto_label.setText(stats['crypto_status'])
-        crypto_label.setStyleSheet(f"color: {crypto_color}; font-size: 16pt; font-weight: bold;")
+        crypto_ok = stats['crypto_status'] == 'OPERATIONAL'
+        crypto_label = self.card_crypto.value_label
+        set_label_text(crypto_label, stats['crypto_status'])
+        set_style_property(crypto_label, "tone", "ok" if crypto_ok else "alert")
 
     def update_clock(self):
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.clock_label.setText(now)
+        set_label_text(self.clock_label, now)
 
     def panic_wipe(self):
         self.processor.burn()
@@ -0,0 +1,52 @@
+"""
+Tests for the studio's DSSS frame sizing.
+
+Run from this folder: python -m unittest test_milcodec_studio
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+
+import milcodec_engine as engine
+import milcodec_studio as studio
+
+
+@unittest.skipUnless(engine.CRYPTO_AVAILABLE, "cryptography not installed")
+class MinFrameSamplesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stego = engine.SteganographyEngine()
+        self.pn_samples = self.stego._chip_table(engine.SAMPLE_RATE).shape[1]
+
+    def test_counts_the_poly1305_tag(self):
+        # Smallest real frame: MAGIC + SALT + NONCE + one plaintext byte + TAG
+        frame = engine.CryptoHelper.encrypt("x", "pw")
+        n_bits = 32 + 8 * (len(frame) - 1)
+        self.assertEqual(self.stego.min_frame_samples(), n_bits * self.pn_samples)
+
+    def test_carrier_one_tag_short_is_rejected(self):
+        app = QApplication.instance() or QApplication([])
+        window = studio.StudioWindow()
+        try:
+            short_bits = 32 + 8 * (len(engine.MAGIC_HEADER) + 16 + 12)
+            window.stego_audio = np.zeros(short_bits * self.pn_samples,
+                                          dtype=np.float32)
+            self.assertLess(len(window.stego_audio),
+                            self.stego.min_frame_samples())
+
+            window.decode_password.setText("pw")
+            window.do_decode()
+            self.assertIsNone(window._worker)
+            self.assertIn("too short", window.status_label.text())
+        finally:
+            window.close()
+            app.processEvents()
+
+
+if __name__ == "__main__":
+    unittest.main()
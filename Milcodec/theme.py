@@ -8,6 +8,7 @@ Provides consistent styling across all Milcodec applications.
 from PyQt6.QtWidgets import QApplication, QWidget, QGraphicsDropShadowEffect
 from PyQt6.QtGui import QFont, QFontDatabase, QColor, QLinearGradient, QPalette
 from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from functools import lru_cache
 import os
 
 # =============================================================================
@@ -93,9 +94,15 @@ class Fonts:
 # STYLESHEET COMPONENTS
 # =============================================================================
 class Styles:
-    """Reusable stylesheet strings for Qt widgets."""
+    """
+    Reusable stylesheet strings for Qt widgets.
+    
+    The palette is fixed at import, so each sheet is formatted on first use
+    and the same string is returned afterwards.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def main_window():
         return f"""
             QMainWindow {{
@@ -104,6 +111,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def sidebar():
         return f"""
             QFrame#Sidebar {{
@@ -130,6 +138,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def header():
         return f"""
             QFrame#Header {{
@@ -152,6 +161,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def panel():
         return f"""
             QFrame.Panel {{
@@ -169,6 +179,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def text_input():
         return f"""
             QLineEdit {{
@@ -190,6 +201,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def text_area():
         return f"""
             QTextEdit {{
@@ -208,6 +220,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def button_primary():
         return f"""
             QPushButton {{
@@ -235,6 +248,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def button_danger():
         return f"""
             QPushButton {{
@@ -257,6 +271,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def button_secondary():
         return f"""
             QPushButton {{
@@ -275,6 +290,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def list_widget():
         return f"""
             QListWidget {{
@@ -299,6 +315,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def progress_bar():
         return f"""
             QProgressBar {{
@@ -316,6 +333,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def scrollbar():
         return f"""
             QScrollBar:vertical {{
@@ -347,6 +365,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def tooltip():
         return f"""
             QToolTip {{
@@ -359,6 +378,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def tab_widget():
         return f"""
             QTabWidget::pane {{
@@ -385,6 +405,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def combo_box():
         return f"""
             QComboBox {{
@@ -411,6 +432,7 @@ class Styles:
         """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def group_box():
         return f"""
             QGroupBox {{
@@ -492,18 +514,14 @@ class StatusColors:
     @staticmethod
     def get_status_style(status: str):
         """Get stylesheet for status indicator dot."""
-        color_map = {
-            'SECURE': StatusColors.SECURE,
-            'CONNECTED': StatusColors.CONNECTED,
-            'PENDING': StatusColors.PENDING,
-            'WARNING': StatusColors.WARNING,
-            'ERROR': StatusColors.ERROR,
-            'OFFLINE': StatusColors.OFFLINE,
-        }
-        color = color_map.get(status.upper(), StatusColors.OFFLINE)
-        return f"""
+        return _STATUS_STYLES.get(status.upper(), _STATUS_STYLES['OFFLINE'])
+
+
+# Finished indicator sheet per status, built once at import
+_STATUS_STYLES = {
+    status: f"""
             QLabel {{
-                background-color: {color};
+                background-color: {getattr(StatusColors, status)};
                 border-radius: 4px;
                 min-width: 8px;
                 max-width: 8px;
@@ -511,24 +529,24 @@ class StatusColors:
                 max-height: 8px;
             }}
         """
+    for status in ('SECURE', 'CONNECTED', 'PENDING', 'WARNING', 'ERROR', 'OFFLINE')
+}
+
 
 # =============================================================================
 # CLASSIFICATION BANNERS
 # =============================================================================
-class Classification:
-    """Classification level styling."""
-    
-    @staticmethod
-    def banner(level: str = "UNCLASSIFIED"):
-        """Get stylesheet for classification banner."""
-        colors = {
-            "UNCLASSIFIED": (Colors.GREEN, Colors.VOID),
-            "CONFIDENTIAL": (Colors.CYAN, Colors.VOID),
-            "SECRET": (Colors.RED, Colors.TEXT_PRIMARY),
-            "TOP SECRET": ("#ff8800", Colors.VOID),
-        }
-        bg, fg = colors.get(level.upper(), (Colors.GREEN, Colors.VOID))
-        return f"""
+_BANNER_COLORS = {
+    "UNCLASSIFIED": (Colors.GREEN, Colors.VOID),
+    "CONFIDENTIAL": (Colors.CYAN, Colors.VOID),
+    "SECRET": (Colors.RED, Colors.TEXT_PRIMARY),
+    "TOP SECRET": ("#ff8800", Colors.VOID),
+}
+
+
+# Finished banner sheet per level, built once at import
+_BANNER_STYLES = {
+    level: f"""
             QLabel {{
                 background-color: {bg};
                 color: {fg};
@@ -538,25 +556,37 @@ class Classification:
                 letter-spacing: 2px;
             }}
         """
+    for level, (bg, fg) in _BANNER_COLORS.items()
+}
+
+
+class Classification:
+    """Classification level styling."""
+    
+    @staticmethod
+    def banner(level: str = "UNCLASSIFIED"):
+        """Get stylesheet for classification banner."""
+        return _BANNER_STYLES.get(level.upper(), _BANNER_STYLES["UNCLASSIFIED"])
 
 # =============================================================================
 # COMPOSITE GLOBAL STYLESHEET
 # =============================================================================
+@lru_cache(maxsize=None)
 def get_complete_stylesheet():
-    """Get the complete application stylesheet."""
-    return (
-        Styles.main_window() +
-        Styles.sidebar() +
-        Styles.header() +
-        Styles.panel() +
-        Styles.text_input() +
-        Styles.text_area() +
-        Styles.button_primary() +
-        Styles.list_widget() +
-        Styles.progress_bar() +
-        Styles.scrollbar() +
-        Styles.tooltip() +
-        Styles.tab_widget() +
-        Styles.combo_box() +
-        Styles.group_box()
-    )
+    """Get the complete application stylesheet (built once)."""
+    return "".join((
+        Styles.main_window(),
+        Styles.sidebar(),
+        Styles.header(),
+        Styles.panel(),
+        Styles.text_input(),
+        Styles.text_area(),
+        Styles.button_primary(),
+        Styles.list_widget(),
+        Styles.progress_bar(),
+        Styles.scrollbar(),
+        Styles.tooltip(),
+        Styles.tab_widget(),
+        Styles.combo_box(),
+        Styles.group_box(),
+    ))